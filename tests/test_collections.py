@@ -89,6 +89,82 @@ def test_stacked_dict():
         assert False, 'Level 0 cannot be poped. It should have raised a TypeError'
 
 
+def test_stacked_dict_lookups_match_levels():
+    from random import Random
+    from xoutil.collections import StackedDict
+    rnd = Random(42)
+    sd = StackedDict(k0=0)
+    for i in range(500):
+        key = 'k%d' % rnd.randrange(8)
+        op = rnd.randrange(4)
+        if op == 0:
+            sd.push(**{key: i})
+        elif op == 1 and sd.level:
+            sd.pop()
+        elif op == 2:
+            sd[key] = i
+        elif key in sd.peek():
+            del sd[key]
+        expected = dict(sd.inner)
+        assert dict(sd) == expected
+        assert len(sd) == len(expected)
+        assert all((k in sd) == (k in expected) for k in ('k0', 'k7'))
+
+
+def test_stacked_dict_levels_changed_directly():
+    from xoutil.collections import ChainMap, StackedDict
+    sd = StackedDict(a=1, b=2)
+    sd.push(c=3, d=4)
+    for key in sd:
+        if key in ('c', 'd'):
+            del sd[key]
+    assert dict(sd) == {'a': 1, 'b': 2}
+    sd.inner.maps[0]['z'] = 5
+    assert 'z' in sd and sd['z'] == 5
+    sd.inner.maps[-1].update(a=10)
+    assert sd['a'] == 10
+    del sd.inner.maps[0]['z']
+    assert 'z' not in sd and len(sd) == 2
+    sd.inner.maps.append({'w': 0})
+    assert sd['w'] == 0 and len(sd) == 3
+    top = {'q': 1}
+    sd.inner = ChainMap(top, {'r': 2})
+    assert dict(sd) == {'q': 1, 'r': 2}
+    top['s'] = 3
+    assert sd['s'] == 3 and len(sd) == 3
+    sd['t'] = 4
+    assert top['t'] == 4
+
+
+def test_opendict_index():
+    from xoutil.collections import opendict, StackedDict
+    d = opendict({'foo-bar': 1, 'baz': 2})
+    assert d.foo_bar == 1
+    # Same-length replacements must be noticed.
+    del d['foo-bar']
+    d['egg spam'] = 3
+    assert d.egg_spam == 3 and not hasattr(d, 'foo_bar')
+    d.pop('egg spam')
+    d.setdefault('x', 4)
+    assert d.x == 4 and not hasattr(d, 'egg_spam')
+    # Shadowed keys take over when the visible one is removed.
+    d['a-b'] = 5
+    d['a b'] = 6
+    visible = (~d)['a_b']
+    del d[visible]
+    assert d.a_b == (6 if visible == 'a-b' else 5)
+    d.update({'y': 7})
+    assert d.y == 7
+    d.clear()
+    assert ~d == {}
+    sd = StackedDict(a=1)
+    assert sd.a == 1
+    sd.push(b=2)
+    assert sd.b == 2
+    sd.pop()
+    assert not hasattr(sd, 'b') and sd.a == 1
+
+
 # Backported from Python 3.3.0 standard library
 from six import PY3
 from xoutil.collections import ChainMap, Counter, OrderedDict, Mapping
@@ -222,6 +298,33 @@ class TestChainMap(unittest.TestCase):
             self.assertEqual(d.get(k, 100), v)
 
 
+def test_merged_view():
+    from xoutil.collections import MergedView
+    from xoutil.objects import dict_merge
+    first = {'a': {'x': 1, 'y': [1]}, 'b': 1, 'c': {'z': 1}}
+    second = {'a': {'y': (2, )}, 'b': 2}
+    view = MergedView(first, second, d=4)
+    assert view['b'] == 2
+    assert view['a']['y'] == [1, 2]
+    assert view['c'] == {'z': 1}
+    assert set(view) == {'a', 'b', 'c', 'd'}
+    assert len(view) == 4
+    assert 'd' in view and 'e' not in view
+    assert dict_merge(first, second, d=4) == {
+        key: dict(val) if isinstance(val, Mapping) else val
+        for key, val in view.items()
+    }
+    shared = [1]
+    assert MergedView({'l': shared}, {'l': shared})['l'] == [1]
+    second['e'] = 5
+    assert view['e'] == 5
+    try:
+        view['f']
+    except KeyError:
+        pass
+    else:
+        assert False, 'Should have raised a KeyError'
+
 
 class TestCounter(unittest.TestCase):
 
@@ -97,6 +97,50 @@ def test_reusing_raises():
             assert False, 'It should have raised a RuntimeError'
 
 
+try:
+    import contextvars
+except ImportError:
+    CONTEXTVARS = False
+else:
+    CONTEXTVARS = True
+
+
+@pytest.mark.skipif(not CONTEXTVARS, reason='contextvars is not available')
+def test_contextvar_storage():
+    from xoutil.context import ContextVarStorage, set_storage
+
+    class Storage(ContextVarStorage):
+        # Stands for the running task.
+        current = 'parent'
+
+        def owner(self):
+            return self.current
+
+    def child():
+        storage.current = 'child'
+        assert context['A']['a'] == 1
+        with context('A', a=2) as a:
+            assert a is not parent
+            assert a['a'] == 2 and a['b'] == 1
+            assert context['A'] is a
+        assert context['A'] is parent
+        storage.current = 'parent'
+
+    storage = Storage()
+    previous = set_storage(storage)
+    try:
+        with context('A', a=1, b=1) as parent:
+            snapshot = contextvars.copy_context()
+            with context('B'):
+                snapshot.run(child)
+                assert context['B']
+            assert parent['a'] == 1 and parent.level == 1
+            assert not snapshot.run(lambda: context['B'])
+        assert not context['A']
+    finally:
+        set_storage(previous)
+
+
 # Test concurrent access to context by several greenlets.  Verify isolation in
 # the greenlets.  We don't test isolation for threads cause that depends on
 # python's thread locals and we *rely* on its correctness.
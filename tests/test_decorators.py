@@ -119,6 +119,71 @@ class RegressionTests(unittest.TestCase):
         self.assertEqual(badguy, foobar(1))
 
 
+class FlatDecorator(unittest.TestCase):
+    def test_wrappers_keep_the_signature(self):
+        from xoutil.decorator import meta
+        from xoutil.decorator.meta import flat_decorator, FunctionMaker
+
+        @flat_decorator
+        def traced(func, *args, **kwargs):
+            calls.append(args)
+            return func(*args, **kwargs)
+
+        @traced
+        def first(a, b=1, *args, **kwargs):
+            'Docs'
+            return a, b, args, kwargs
+
+        compiled = len(meta._compiled)
+
+        @traced
+        def second(a, b=2, *args, **kwargs):
+            return a + b
+
+        def unusual(a, _func_=None):
+            return a
+
+        calls = []
+        self.assertEqual(first(1, c=3), (1, 1, (), {'c': 3}))
+        self.assertEqual(second(1), 3)
+        self.assertEqual(calls, [(1, 1), (1, 2)])
+        self.assertEqual((first.__name__, first.__doc__), ('first', 'Docs'))
+        self.assertEqual(first.__defaults__, (1, ))
+        self.assertIn('def first(a, b, *args, **kwargs)', first.__source__)
+        # Same signature, nothing compiled
+        self.assertEqual(len(meta._compiled), compiled)
+        self.assertIsNot(first.__wrapped__, second.__wrapped__)
+        # Signatures clashing with the template are rejected
+        self.assertIsNone(FunctionMaker.wrap(unusual, traced))
+        with self.assertRaises(NameError):
+            traced(unusual)
+
+    def test_call_through(self):
+        from xoutil.decorator.meta import call_through
+
+        def check(func, a, b=None, *rest):
+            if a < 0:
+                raise ValueError(a)
+
+        def double(func, result):
+            return 2 * result
+
+        @call_through(before=check, after=double)
+        def add(a, b=1, *rest):
+            return a + b + sum(rest)
+
+        def plain(a, _func_=None):
+            return a
+
+        self.assertEqual(add(1), 4)
+        self.assertEqual(add(1, 2, 3), 12)
+        self.assertRaises(ValueError, add, -1)
+        self.assertEqual(add.__defaults__, (1, ))
+        self.assertIn('_func_(a, b, *rest)', add.__source__)
+        self.assertIs(call_through(plain), plain)
+        self.assertEqual(call_through(plain, after=double)(1), 2)
+
+
 class Memoizations(unittest.TestCase):
     def test_memoized_property(self):
         from xoutil.inspect import getattr_static
@@ -64,6 +64,99 @@ class TestFs(unittest.TestCase):
         res = list(iter_files(self.base, '(?xi)/Z', maxdepth=2))
         self.assertEquals(0, len(res))
 
+    def test_iter_files_with_threads(self):
+        from xoutil.fs import iter_files
+        expected = sorted(iter_files(self.base))
+        self.assertEqual(len(expected), len(self.files))
+        self.assertEqual(sorted(iter_files(self.base, threads=3)), expected)
+        res = list(iter_files(self.base, '(?xi)/Z', maxdepth=3, threads=2))
+        self.assertEqual(res, [self.files[-1][-1]])
+
+    def test_iter_files_does_not_follow_links(self):
+        from xoutil.fs import iter_files, iter_dirs
+        link = os.path.join(self.base, 'A', 'F', 'link')
+        os.symlink(os.path.join(self.base, 'A', 'B'), link)
+        res = list(iter_files(os.path.join(self.base, 'A', 'F')))
+        self.assertEqual(res, [self.files[-1][-1]])
+        res = list(iter_files(os.path.join(self.base, 'A', 'F'),
+                              followlinks=True))
+        self.assertEqual(len(res), 4)
+        self.assertEqual(len(list(iter_dirs(self.base))), 7)
+        self.assertEqual(len(list(iter_dirs(self.base, threads=2))), 7)
+
+    def test_file_index(self):
+        from xoutil.fs import iter_files, iter_dirs
+        from xoutil.fs.index import FileIndex
+        # Outside the tree, or writing to it would change the tree.
+        fd, dbname = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.addCleanup(os.remove, dbname)
+        index = FileIndex(self.base, dbname)
+        self.assertEqual(list(index.iter_files()), [])
+        self.assertEqual(index.refresh(), 7)
+        self.assertEqual(sorted(index.iter_files('(?xi)/Z')),
+                         sorted(iter_files(self.base, '(?xi)/Z')))
+        self.assertEqual(sorted(index.iter_files(maxdepth=3)),
+                         sorted(iter_files(self.base, maxdepth=3)))
+        self.assertEqual(sorted(index.iter_dirs()),
+                         sorted(iter_dirs(self.base)))
+        self.assertEqual(index.refresh(), 0)
+
+        # Only the changed directories are listed again.
+        new = os.path.join(self.base, 'A', 'D', 'E', 'new.txt')
+        with open(new, 'w') as f:
+            f.write('1234')
+        shutil.rmtree(os.path.join(self.base, 'A', 'B'))
+        self.assertEqual(index.refresh(), 2)
+        self.assertIn((new, 4), [(path, size) for path, size, _ in
+                                 index.iter_stats('*.txt')])
+        self.assertEqual(sorted(index.iter_files()),
+                         sorted(iter_files(self.base)))
+        index.close()
+
+    def test_concatfiles(self):
+        import io
+        from six import PY2
+        from xoutil.fs import concatfiles
+        sources = []
+        for i, content in enumerate([b'abc', b'', b'x' * 70000, b'def']):
+            name = os.path.join(self.base, 'source-%d' % i)
+            with open(name, 'wb') as f:
+                f.write(content)
+            sources.append(name)
+        expected = b'abc' + b'x' * 70000 + b'def'
+        target = os.path.join(self.base, 'target')
+        for threads in (None, 3):
+            concatfiles(sources, target, threads=threads)
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), expected)
+
+        # Mixing file objects in the middle of a file and other streams.
+        with open(sources[0], 'rb') as first, open(target, 'wb') as fh:
+            first.read(1)
+            fh.write(b'>')
+            concatfiles(first, io.BytesIO(b'123'), sources[3], fh)
+            fh.write(b'<')
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), b'>bc123def<')
+        out = io.BytesIO()
+        concatfiles(sources, out)
+        self.assertEqual(out.getvalue(), expected)
+
+        # Python 2 files (even in text mode) don't take memoryviews.
+        mode = 'w' if PY2 else 'wb'
+        with open(target, mode) as fh:
+            concatfiles(io.BytesIO(b'abc'), io.BytesIO(b'def'), fh)
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), b'abcdef')
+
+    def test_imap_keeps_the_listing_order(self):
+        from xoutil.fs import imap
+        top = os.path.join(self.base, 'A')
+        expected = [os.path.join(top, name) for name in os.listdir(top)]
+        found = list(imap(lambda path, st: path, os.path.join(top, '*')))
+        self.assertEqual(found, expected)
+
     def test_walk_up(self):
         from xoutil.fs import walk_up
         expected, start = self.walk_up_expected, self.walk_up_start
@@ -72,6 +72,203 @@ def test_lrucache_stats():
 from xoutil.functools import compose
 
 
+def test_fast_key_shapes():
+    from xoutil.functools import _fast_key, _make_key
+    calls = [((1, ), {}), (((1, ), ), {}), ((1, 2), {}), (((1, 2), ), {}),
+             ((1, ), {'a': 2}), ((1, 'a', 2), {}), ((), {'a': 1, 'b': 2}),
+             ((1.0, ), {}), (('1', ), {})]
+    keys = [_fast_key(args, kwds, False) for args, kwds in calls]
+    for key in keys:
+        hash(key)
+    assert len(set(keys)) == len(calls)
+    assert _fast_key((), {'b': 2, 'a': 1}, False) == keys[6]
+    assert _fast_key((1, ), {}, True) == _make_key((1, ), {}, True)
+
+
+def test_memoize_policies():
+    from xoutil.functools import memoize
+    calls = []
+
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    lru = memoize(maxsize=2)(double)
+    lru(1), lru(2), lru(1), lru(3)    # 2 is the least recently used
+    assert lru(1) == 2 and calls == [1, 2, 3]
+    assert lru(2) == 4 and calls == [1, 2, 3, 2]
+    del calls[:]
+    lfu = memoize(maxsize=2, policy='lfu')(double)
+    lfu(1), lfu(1), lfu(2), lfu(3)    # 2 is the least frequently used
+    lfu(1), lfu(3)
+    assert calls == [1, 2, 3]
+    assert lfu.cache_info() == (3, 3, 2, 2)
+    lfu.cache_clear()
+    assert lfu.cache_info() == (0, 0, 2, 0)
+    try:
+        memoize(policy='random')
+    except ValueError:
+        pass
+    else:
+        assert False, 'Should have raised a ValueError'
+
+
+def test_memoize_ttl():
+    from xoutil.functools import memoize
+    now = [0]
+    calls = []
+
+    @memoize(ttl=lambda result: result, timer=lambda: now[0])
+    def ident(x):
+        calls.append(x)
+        return x
+
+    ident(1), ident(5)
+    now[0] = 2
+    ident(1), ident(5)
+    assert calls == [1, 5, 1]
+    assert ident.cache_info().hits == 1
+
+
+def test_memoize_method():
+    import gc
+    from xoutil.functools import memoize_method
+    calls = []
+
+    class Foo(object):
+        @memoize_method(maxsize=10)
+        def add(self, x, y=0):
+            calls.append((self, x, y))
+            return x + y
+
+    foo, bar = Foo(), Foo()
+    assert foo.add(1, y=2) == foo.add(1, y=2) == bar.add(1, y=2) == 3
+    assert len(calls) == 2
+    assert foo.add.cache_info().currsize == 1
+    assert Foo.add.__name__ == 'add'
+    del foo, calls[:]
+    gc.collect()
+    assert len(Foo.__dict__['add'].instances) == 1
+
+
+def test_memoize_coalesces_threads():
+    import threading
+    import time
+    from xoutil.functools import memoize
+    calls = []
+    started = threading.Event()
+    proceed = threading.Event()
+
+    @memoize(coalesce=True)
+    def compute(x):
+        calls.append(x)
+        started.set()
+        proceed.wait(5)
+        return x
+
+    first = threading.Thread(target=compute, args=(1, ))
+    first.start()
+    started.wait(5)
+    others = [threading.Thread(target=compute, args=(1, )) for _ in range(4)]
+    for thread in others:
+        thread.start()
+    deadline = time.time() + 5
+    while compute.cache_stats().misses < 5 and time.time() < deadline:
+        time.sleep(0.001)
+    proceed.set()
+    for thread in [first] + others:
+        thread.join(5)
+    assert not any(thread.is_alive() for thread in [first] + others)
+    assert calls == [1]
+    assert compute.cache_stats()[:3] == (0, 5, 4)
+
+
+def test_async_memoize():
+    import pytest
+    asyncio = pytest.importorskip('asyncio')
+    from xoutil.functools import async_memoize
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    calls = []
+
+    @async_memoize()
+    def compute(x):
+        # Plain functions returning a future are awaitable just like
+        # coroutine functions.
+        calls.append(x)
+        res = loop.create_future()
+        loop.call_later(0.01, res.set_result, 2 * x)
+        return res
+
+    try:
+        results = loop.run_until_complete(
+            asyncio.gather(*[compute(1) for _ in range(5)])
+        )
+        assert results == [2] * 5
+        assert loop.run_until_complete(compute(1)) == 2
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    assert calls == [1]
+    assert compute.cache_stats()[:3] == (1, 5, 4)
+
+
+def test_disk_memoize():
+    import os
+    from tempfile import mkstemp
+    from xoutil.functools import disk_memoize
+    fd, filename = mkstemp()
+    os.close(fd)
+    calls = []
+
+    def square(x, y=1):
+        calls.append(x)
+        return {'value': x * x * y}
+
+    try:
+        first = disk_memoize(filename, maxsize=3, memory=0,
+                             namespace='square')(square)
+        for x in (1, 2, 3, 1, 4):
+            first(x)
+        assert calls == [1, 2, 3, 4]
+        assert first.cache_info() == (1, 4, 3, 3)
+        # As if in another process: 2 was the least recently used.
+        second = disk_memoize(filename, namespace='square')(square)
+        assert [second(x)['value'] for x in (1, 3, 4)] == [1, 9, 16]
+        assert calls == [1, 2, 3, 4]
+        assert second(2, y=2) == {'value': 8}
+        other = disk_memoize(filename, namespace='other')(square)
+        other(1)
+        assert calls == [1, 2, 3, 4, 2, 1]
+        second.cache_clear()
+        assert second.cache_info().currsize == 0
+        assert other.cache_info().currsize == 1
+    finally:
+        os.unlink(filename)
+
+
+def test_disk_memoize_keys():
+    import os
+    import subprocess
+    import sys
+    from xoutil.functools import _stable_key
+    shared = ''.join(['a', 'b'])
+    separate = (''.join(['a', 'b']), ''.join(['a', 'b']))
+    assert separate[0] is not separate[1]
+    assert (_stable_key('f', (shared, shared), {}, False) ==
+            _stable_key('f', separate, {}, False))
+    # The order of sets and dicts changes with the hash seed.
+    code = ('from xoutil.functools import _stable_key; '
+            'print(_stable_key("f", (set("abcdefgh"), ), '
+            '{"x": {"b": 1, "a": 2}}, False))')
+    keys = set()
+    for seed in ('1', '2', '3'):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        keys.add(subprocess.check_output([sys.executable, '-c', code],
+                                         env=env))
+    assert len(keys) == 1
+
+
 class TestCompose(unittest.TestCase):
     def test_needs_at_least_an_argument(self):
         with self.assertRaises(TypeError):
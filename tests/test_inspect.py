@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#----------------------------------------------------------------------
+# xoutil.tests.test_inspect
+#----------------------------------------------------------------------
+# Copyright (c) 2015 Merchise Autrement and Contributors
+# All rights reserved.
+#
+# This is free software; you can redistribute it and/or modify it under
+# the terms of the LICENCE attached in the distribution package.
+#
+# Created on 2015-05-04
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import)
+
+import pytest
+
+
+def test_get_attr_value_follows_class_changes():
+    from xoutil.inspect import get_attr_value
+
+    class Root(object):
+        pass
+
+    class Base(Root):
+        attr = 'base'
+
+    class Other(object):
+        attr = 'other'
+
+    class Derived(Base):
+        @property
+        def prop(self):
+            return 'prop'
+
+        def __getattr__(self, name):
+            return 'dynamic'
+
+    obj = Derived()
+    obj.__dict__['prop'] = 'shadowed'
+    obj.value = 1
+    assert get_attr_value(obj, 'attr') == 'base'
+    assert get_attr_value(obj, 'prop') == 'prop'
+    assert get_attr_value(obj, 'value') == 1
+    assert get_attr_value(obj, 'missing', None) is None
+    with pytest.raises(AttributeError):
+        get_attr_value(obj, 'missing')
+    Derived.attr = 'derived'
+    Derived.missing = 'found'
+    assert get_attr_value(obj, 'attr') == 'derived'
+    assert get_attr_value(obj, 'missing') == 'found'
+    del Derived.attr
+    Base.__bases__ = (Other, )
+    del Base.attr
+    assert get_attr_value(obj, 'attr') == 'other'
+    assert get_attr_value(Derived, '__name__') == 'Derived'
+
+
+def test_static_lookup_agrees_with_getattr_static():
+    from xoutil.inspect import getattr_static, _static_lookup
+
+    class Meta(type):
+        meta = 'meta'
+
+    class Base(object):
+        attr = 1
+
+    class Slotted(Base):
+        __slots__ = ('slot', )
+
+    Klass = Meta(str('Klass'), (Base, ), {})
+    slotted = Slotted()
+    slotted.slot = 1
+    names = ('attr', 'slot', 'meta', 'mro', '__dict__', '__class__',
+             'missing')
+    for obj in (Klass, Klass(), slotted, Slotted, Meta, 1, len, object()):
+        for name in names:
+            assert (getattr_static(obj, name, None) ==
+                    _static_lookup(obj, name, None))
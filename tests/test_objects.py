@@ -97,6 +97,37 @@ def test_smart_copy_with_callable_default():
     assert d == dict(a=1, b='2')
 
 
+def test_smart_copier():
+    from xoutil.objects import smart_copier
+    from xoutil.types import Required
+
+    class new(object):
+        def __init__(self, **kw):
+            for k, v in kw.items():
+                setattr(self, k, v)
+
+    copy = smart_copier(new, dict)
+    assert copy(new(a=1, b=2, _d=5), {}) == dict(a=1, b=2)
+    copy = smart_copier(new, dict, True)
+    assert copy(new(a=1, _d=5), {})['_d'] == 5
+    copy = smart_copier(dict, new, defaults=lambda key, **kw: key != 'b')
+    target = copy({'a': 1, 'b': 2, 'not valid': 3}, new())
+    assert target.__dict__ == dict(a=1)
+
+    copy = smart_copier(dict, new, defaults={'a': 0, 'x': Required,
+                                             'not valid': 1})
+    target = copy({'x': 1}, new())
+    assert target.__dict__ == dict(a=0, x=1)
+    with pytest.raises(KeyError):
+        copy({'a': 1}, new())
+
+    copy = smart_copier(dict, dict, defaults=('a', 'x'))
+    assert copy({'a': 1, 'b': 2}, {}) == dict(a=1, x=None)
+
+    with pytest.raises(TypeError):
+        smart_copier(dict, int)
+
+
 def test_newstyle_metaclass():
     from xoutil.objects import metaclass
 
@@ -229,6 +260,45 @@ def test_traversing():
     assert traverser(obj) == (1, 2, None)
 
 
+def test_traversing_compiled_paths():
+    from xoutil.objects import traverse, get_traverser, _compile_traverser
+    obj = new(**{'a': 1, 'b.c': {'x': {'y': 2}}})
+    assert traverse(obj, 'b/c/x/y', sep='/') == 2
+    assert traverse(obj, 'b.c.x.z', default=None) is None
+    assert get_traverser('b.c.x.z', default=3)(obj) == 3
+
+    # The same compiled path is reused regardless of the default.
+    assert _compile_traverser('b.c.x', '.', None) is \
+        _compile_traverser('b.c.x', '.', None)
+    assert get_traverser('b.c.x')(obj) == {'y': 2}
+
+    def getter(obj, attr, default):
+        return getattr(obj, attr.upper(), default)
+    obj.A = obj
+    obj.B = 4
+    assert traverse(obj, 'a.a.b', getter=getter) == 4
+
+    with pytest.raises(TypeError):
+        get_traverser('a', defualt=None)
+
+
+def test_traverse_columns():
+    from array import array
+    from xoutil.objects import traverse_columns
+    objs = [new(**{'a': i, 'b.c': {'x': str(i)}}) for i in range(4)]
+    assert traverse_columns(objs, 'a') == [0, 1, 2, 3]
+    xs, as_ = traverse_columns(iter(objs), 'b.c.x', 'a')
+    assert xs == ['0', '1', '2', '3']
+    assert as_ == [0, 1, 2, 3]
+    col = traverse_columns(objs, 'a', typecodes='l')
+    assert col == array(str('l'), [0, 1, 2, 3])
+    assert traverse_columns(objs, 'b.y', default=0) == [0] * 4
+    with pytest.raises(AttributeError):
+        traverse_columns(objs, 'b.y')
+    with pytest.raises(TypeError):
+        traverse_columns(objs, 'a', 'b', typecodes='l')
+
+
 def test_dict_merge_base_cases():
     from xoutil.objects import dict_merge
     base = {'a': 'a', 'd': {'attr1': 2}}
@@ -278,6 +348,23 @@ def test_dict_merge_errors():
         dict_merge(first, second)
 
 
+def test_dict_merge_several_layers():
+    from xoutil.objects import dict_merge
+    layers = [{'a': {'b': {'c': [i], 'd': i}}, 'e': (i, )} for i in range(5)]
+    result = dict_merge(*layers)
+    assert result == {'a': {'b': {'c': [0, 1, 2, 3, 4], 'd': 4}},
+                      'e': (0, 1, 2, 3, 4)}
+    assert result['a'] is not layers[0]['a']
+    assert layers[0] == {'a': {'b': {'c': [0], 'd': 0}}, 'e': (0, )}
+    with pytest.raises(TypeError):
+        dict_merge(*(layers + [{'a': {'b': {'d': [5]}}}]))
+    # The same object in several layers is not joined with itself.
+    shared = [1, 2]
+    assert dict_merge({'a': shared}, {'a': shared}) == {'a': [1, 2]}
+    assert dict_merge({'a': shared}, {'a': shared}, {'a': [3]}) == {
+        'a': [1, 2, 3]}
+
+
 def test_get_first_of():
     from xoutil.objects import get_first_of
     somedict = {"foo": "bar", "spam": "eggs"}
@@ -360,3 +447,36 @@ def test_extract_attrs():
     with pytest.raises(AttributeError):
         assert extract_attrs(d, 'y')
     assert extract_attrs(d, 'y', default=None) is None
+
+
+def test_dir_listings_follow_class_changes():
+    from xoutil.objects import xdir, fdir, fulldir
+
+    class Base(object):
+        base = 1
+
+    class Derived(Base):
+        def method(self):
+            pass
+
+    class Custom(Base):
+        def __dir__(self):
+            return ['base']
+
+    obj = Derived()
+    obj.value = 2
+    public = lambda attr, value: not attr.startswith('_')
+    for target in (Base, Derived, obj, Custom(), 1):
+        assert sorted(fdir(target)) == dir(target)
+        assert sorted(fdir(target)) == dir(target)
+    assert list(fdir(obj, filter=public)) == ['base', 'method', 'value']
+    # Listings are refreshed when the number of names changes.
+    Base.added = 3
+    assert list(fdir(obj, filter=public)) == ['added', 'base', 'method',
+                                              'value']
+    assert list(fdir(Derived, filter=public)) == ['added', 'base', 'method']
+    del Base.base
+    assert list(fdir(obj, filter=public)) == ['added', 'method', 'value']
+    assert dict(xdir(Derived, filter=public))['added'] == 3
+    assert {'added', 'method', 'value', '__class__'} <= fulldir(obj)
+    assert 'added' in fulldir(Derived) and 'base' not in fulldir(Derived)
@@ -116,3 +116,23 @@ class TestProxy(unittest.TestCase):
         unboxed(p, 'unassigned') << 1
         self.assertEqual(1, unboxed(p).unassigned)
         self.assertFalse(hasattr(x, 'unassigned'))
+
+    def test_dispatch_per_behaves(self):
+        @proxify
+        class Proxified(object):
+            behaves = [HackedHi]
+
+            def __init__(self, target, behaves=None):
+                self.target = target
+                if behaves is not None:
+                    self.behaves = behaves
+
+        foo = Foobar()
+        hacked, plain = Proxified(foo), Proxified(foo, behaves=[])
+        for _ in range(2):
+            self.assertIs(hacked.hi(), hacked)
+            self.assertIs(hacked.hi.__self__, hacked)
+            self.assertEqual(plain.hi.__self__, foo)
+            self.assertIs(plain.target, foo)
+        self.assertTrue(hacked == hacked)
+        self.assertFalse(hacked != hacked)
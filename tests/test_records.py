@@ -129,6 +129,75 @@ class TestRecords(unittest.TestCase):
         self.assertEqual(LINE.get_field(partialdata, LINE.CREDIT), 0)
         self.assertEqual(LINE.get_field(nulls, LINE.DEBIT), 0)
 
+    def test_read_many(self):
+        from array import array
+        from xoutil.records import float_reader, integer_reader
+
+        class LINE(record):
+            ID = 0
+            DEBIT = 1
+            _id_reader = lambda val: int(val)
+            _debit_reader = float_reader(nullable=True, default=0)
+
+        rows = [('1', '2.5'), ('2', ''), ('3', )]
+        result = LINE.read_many(iter(rows))
+        self.assertEqual(result, {'id': [1, 2, 3], 'debit': [2.5, 0, 0]})
+        result = LINE.read_many(rows, fields=[LINE.DEBIT], numeric='array')
+        self.assertEqual(result, {'debit': array(str('d'), [2.5, 0, 0])})
+
+        LINE._id_reader = staticmethod(lambda val: val)
+        self.assertEqual(LINE.read_many(rows, [LINE.ID])['id'],
+                         ['1', '2', '3'])
+
+        # Integers that don't fit in the array stay in a list.
+        LINE._id_reader = staticmethod(integer_reader())
+        huge = [(str(2 ** 64), ), ('1', )]
+        self.assertEqual(LINE.read_many(huge, [LINE.ID], numeric='array'),
+                         {'id': [2 ** 64, 1]})
+        typecode = str(LINE._id_reader.typecode)
+        self.assertEqual(LINE.read_many(rows, [LINE.ID], numeric='array'),
+                         {'id': array(typecode, [1, 2, 3])})
+
+        # Errors in readers are not mistaken for missing values.
+        def failing(val):
+            raise KeyError(val)
+        LINE._id_reader = staticmethod(failing)
+        with self.assertRaises(KeyError):
+            LINE.read_many(rows, [LINE.ID])
+
+    def test_read_csv(self):
+        import os
+        import tempfile
+        from io import StringIO
+        fd, fname = tempfile.mkstemp(suffix='.csv')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                for i in range(25):
+                    f.write('%d,name-%d,%d.5\n' % (i, i, i))
+            batches = list(_amount.read_csv(fname, chunksize=10))
+            self.assertEqual([len(b['id']) for b in batches], [10, 10, 5])
+            self.assertEqual(batches[2]['amount'], [20.5, 21.5, 22.5, 23.5,
+                                                    24.5])
+            pooled = list(_amount.read_csv(fname, chunksize=10, processes=2))
+            self.assertEqual(pooled, batches)
+        finally:
+            os.remove(fname)
+
+        class ROW(record):
+            NAME = 'name'
+            AGE = 'age'
+            _age_reader = lambda val: int(val)
+
+        batches = list(ROW.read_csv(StringIO('name,age\nJohn,42\n')))
+        self.assertEqual(batches, [{'name': ['John'], 'age': [42]}])
+
+
+class _amount(_table):
+    NAME = 1
+    AMOUNT = 2
+
+    _amount_reader = lambda val: float(val)
+
 
 FMT = '%Y-%m-%d'
 
@@ -178,6 +247,26 @@ class TestDateTimeReader(unittest.TestCase):
         inst = rec(['201-12-17'])
         self.assertEquals(inst.moment, 0)
 
+    def test_fast_formats(self):
+        from datetime import datetime
+        formats = ('%Y-%m-%d', '%Y%m%d', '%Y-%m-%d %H:%M:%S',
+                   '%Y-%m-%dT%H:%M:%S.%f')
+        moment = datetime(2015, 4, 9, 13, 5, 7, 123)
+        for fmt in formats:
+            reader = datetime_reader(fmt)
+            value = moment.strftime(fmt)
+            self.assertEqual(reader(value), datetime.strptime(value, fmt))
+        reader = datetime_reader('%Y-%m-%d')
+        # Not the exact width: strptime is used.
+        self.assertEqual(reader('2015-4-9'), datetime(2015, 4, 9))
+        with self.assertRaises(ValueError):
+            reader('2015-02-30')
+
+    def test_cache(self):
+        reader = datetime_reader(FMT, cache=2)
+        self.assertIs(reader('2014-12-17'), reader('2014-12-17'))
+        self.assertEqual(reader.cache_info().hits, 1)
+
 
 class TestDateReader(unittest.TestCase):
     def setUp(self):
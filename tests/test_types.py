@@ -52,6 +52,63 @@ def test_iscollection():
     assert is_collection(Foobar()) is False
 
 
+def test_scalars_and_iterables():
+    from datetime import date
+    from decimal import Decimal
+    from xoutil.types import is_iterable, is_scalar, is_collection
+
+    class Number(int):
+        def __iter__(self):
+            return iter(range(self))
+
+    class Closable(object):
+        closed = False
+
+        def __iter__(self):
+            if self.closed:
+                raise ValueError('closed')
+            return iter(())
+
+    closed = Closable()
+    closed.closed = True
+    for value in (1, 1.5, None, True, Decimal('1'), date.today()):
+        assert is_scalar(value) and not is_iterable(value)
+        assert not is_collection(value)
+    assert is_scalar('text') and is_iterable('text')
+    for value in ([], (), set(), frozenset(), {}):
+        assert not is_scalar(value) and is_iterable(value)
+    assert is_collection([]) and not is_collection({})
+    assert is_iterable(Number(2)) and not is_scalar(Number(2))
+    assert is_iterable(Closable()) and not is_iterable(closed)
+    assert is_scalar(closed)
+
+
+def test_mro_dict():
+    from xoutil.types import mro_dict
+
+    class Base(object):
+        first = 1
+        second = 2
+
+    class Derived(Base):
+        second = 3
+        third = 4
+
+    mro = mro_dict(Derived())
+    assert mro['second'] == 3
+    assert mro['first'] == 1
+    assert 'third' in mro and 'fourth' not in mro
+    assert mro.owner('first') is Base and mro.owner('second') is Derived
+    names = list(mro)
+    assert len(names) == len(set(names)) == len(mro)
+    assert names.index('second') < names.index('first')
+    Derived.fourth = 5
+    assert mro.get('fourth') is None
+    mro.refresh()
+    assert mro['fourth'] == 5
+    assert mro_dict(Derived).get('fifth', 6) == 6
+
+
 class MappingProxyTests(unittest.TestCase):
     mappingproxy = xoutil.types.MappingProxyType
 
@@ -26,7 +26,7 @@ from __future__ import (division as _py3_division,
 # WARNING: We removed the greenlet protection gevent.local does while
 # initializing a subclass of `local`.  Instead we simply provide protection at
 # the thread level, so sub-classes of `local` MUST NOT switch greenlets.
-from threading import RLock
+from threading import RLock, local as _threading_local
 
 
 # since each thread has its own greenlet we can just use those as identifiers
@@ -36,9 +36,12 @@ try:
     from greenlet import getcurrent
 except ImportError:
     from threading import current_thread as getcurrent
+    _GREENLETS = False
+else:
+    _GREENLETS = True
 
 
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, ref as _weakref
 from copy import copy
 
 
@@ -49,7 +52,8 @@ __all__ = ["local"]
 
 
 class _localbase(object):
-    __slots__ = '_local__args', '_local__lock', '_local__dicts'
+    __slots__ = ('_local__args', '_local__lock', '_local__dicts',
+                 '_local__current')
 
     def __new__(cls, *args, **kw):
         self = object.__new__(cls)
@@ -65,15 +69,18 @@ class _localbase(object):
         # We need to create the greenlet dict in anticipation of
         # __init__ being called, to make sure we don't call it again ourselves.
         dict = object.__getattribute__(self, '__dict__')
-        dicts[getcurrent()] = dict
+        current = getcurrent()
+        dicts[current] = dict
+        object.__setattr__(self, '_local__current', _weakref(current))
         return self
 
 
-def _init_locals(self):
+def _init_locals(self, current):
     d = {}
     dicts = object.__getattribute__(self, '_local__dicts')
-    dicts[getcurrent()] = d
+    dicts[current] = d
     object.__setattr__(self, '__dict__', d)
+    object.__setattr__(self, '_local__current', _weakref(current))
 
     # we have a new instance dict, so call out __init__ if we have one
     cls = type(self)
@@ -82,56 +89,50 @@ def _init_locals(self):
         cls.__init__(self, *args, **kw)
 
 
-class local(_localbase):
+def _bind_locals(self, current):
+    '''Make `__dict__` the one of the `current` greenlet.'''
+    d = object.__getattribute__(self, '_local__dicts').get(current)
+    if d is None:
+        # it's OK to acquire the lock here and not earlier, because the
+        # above code won't switch out however, subclassed __init__ might
+        # switch, so we do need to acquire the lock here
+        lock = object.__getattribute__(self, '_local__lock')
+        lock.acquire()
+        try:
+            _init_locals(self, current)
+        finally:
+            lock.release()
+    else:
+        object.__setattr__(self, '__dict__', d)
+        object.__setattr__(self, '_local__current', _weakref(current))
+
+
+class _greenlet_local(_localbase):
+    # The greenlet whose dict is bound is remembered in `_local__current`, so
+    # that accessing the attributes from the same greenlet again doesn't need
+    # to look it up.
 
     def __getattribute__(self, name):
-        d = object.__getattribute__(self, '_local__dicts').get(getcurrent())
-        if d is None:
-            # it's OK to acquire the lock here and not earlier, because the
-            # above code won't switch out however, subclassed __init__ might
-            # switch, so we do need to acquire the lock here
-            lock = object.__getattribute__(self, '_local__lock')
-            lock.acquire()
-            try:
-                _init_locals(self)
-                return object.__getattribute__(self, name)
-            finally:
-                lock.release()
-        else:
-            object.__setattr__(self, '__dict__', d)
-            return object.__getattribute__(self, name)
+        current = getcurrent()
+        if object.__getattribute__(self, '_local__current')() is not current:
+            _bind_locals(self, current)
+        return object.__getattribute__(self, name)
 
     def __setattr__(self, name, value):
         if name == '__dict__':
             raise AttributeError("%r object attribute '__dict__' is read-only" % self.__class__.__name__)
-        d = object.__getattribute__(self, '_local__dicts').get(getcurrent())
-        if d is None:
-            lock = object.__getattribute__(self, '_local__lock')
-            lock.acquire()
-            try:
-                _init_locals(self)
-                return object.__setattr__(self, name, value)
-            finally:
-                lock.release()
-        else:
-            object.__setattr__(self, '__dict__', d)
-            return object.__setattr__(self, name, value)
+        current = getcurrent()
+        if object.__getattribute__(self, '_local__current')() is not current:
+            _bind_locals(self, current)
+        return object.__setattr__(self, name, value)
 
     def __delattr__(self, name):
         if name == '__dict__':
             raise AttributeError("%r object attribute '__dict__' is read-only" % self.__class__.__name__)
-        d = object.__getattribute__(self, '_local__dicts').get(getcurrent())
-        if d is None:
-            lock = object.__getattribute__(self, '_local__lock')
-            lock.acquire()
-            try:
-                _init_locals(self)
-                return object.__delattr__(self, name)
-            finally:
-                lock.release()
-        else:
-            object.__setattr__(self, '__dict__', d)
-            return object.__delattr__(self, name)
+        current = getcurrent()
+        if object.__getattribute__(self, '_local__current')() is not current:
+            _bind_locals(self, current)
+        return object.__delattr__(self, name)
 
     def __copy__(self):
         currentId = getcurrent()
@@ -148,5 +149,28 @@ class local(_localbase):
         object.__setattr__(instance, '_local__dicts', {
             currentId: duplicate
         })
+        object.__setattr__(instance, '__dict__', duplicate)
+        object.__setattr__(instance, '_local__current', _weakref(currentId))
 
         return instance
+
+
+class _thread_local(_threading_local):
+    # Without greenlets the isolation is the same of `threading.local`, which
+    # is implemented in C and has no per-access overhead.
+    __slots__ = ('_local__args', )
+
+    def __new__(cls, *args, **kw):
+        self = super(_thread_local, cls).__new__(cls, *args, **kw)
+        self._local__args = (args, kw)
+        return self
+
+    def __copy__(self):
+        args, kw = self._local__args
+        instance = type(self)(*args, **kw)
+        instance.__dict__.clear()
+        instance.__dict__.update(self.__dict__)
+        return instance
+
+
+local = _greenlet_local if _GREENLETS else _thread_local
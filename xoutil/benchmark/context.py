@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare entering and leaving `xoutil.context.context` with the
+thread-local and the `contextvars` storages.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from xoutil.context import context, set_storage
+from xoutil.context import ThreadLocalStorage, ContextVarStorage
+
+
+def enter_exit():
+    with context('BENCHMARK', value=1):
+        pass
+
+
+def nested_enter_exit():
+    with context('BENCHMARK', value=1):
+        with context('BENCHMARK', value=2):
+            pass
+
+
+def lookup():
+    return context['BENCHMARK']
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark xoutil.context storages.')
+    parser.add_argument('--number', type=int, default=20000,
+                        help='Calls per timing loop.')
+    args = parser.parse_args()
+    storages = [('thread-local', ThreadLocalStorage)]
+    try:
+        storages.append(('contextvars', ContextVarStorage))
+        ContextVarStorage()
+    except ImportError:
+        storages.pop()
+        print('contextvars is not available.')
+    for name, storage in storages:
+        set_storage(storage())
+        print(name)
+        for case in (enter_exit, nested_enter_exit, lookup):
+            ns = best(case, args.number)
+            print('  %-20s %10.1f ns/call' % (case.__name__, ns))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Measure the costs of the wrappers made by `xoutil.decorator.meta`.
+
+First, the (import time) cost of decorating a module worth of functions with
+a few common signatures:
+
+- compiling every wrapper, as `FunctionMaker.create` did before caching the
+  compiled templates;
+
+- with `FunctionMaker.create` and the compiled templates;
+
+- with `flat_decorator`, which builds the wrappers without evaluating any
+  source.
+
+Then, the overhead per call of the wrappers of `flat_decorator` and
+`call_through` over calling a bare function.
+
+'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from functools import wraps
+
+from xoutil.decorator.meta import FunctionMaker, flat_decorator, call_through
+from xoutil.decorator import meta
+
+
+SIGNATURES = ('self', 'self, value', 'self, *args, **kwargs', 'a, b=1',
+              'request, pk=None, *args, **kwargs')
+
+
+def functions(count):
+    '''Create `count` functions with different names and a few signatures.'''
+    namespace = {}
+    for i in range(count):
+        src = 'def func_%d(%s):\n    return None\n' % (
+            i, SIGNATURES[i % len(SIGNATURES)])
+        exec(src, namespace)
+    return [namespace['func_%d' % i] for i in range(count)]
+
+
+def caller(func, *args, **kwargs):
+    return func(*args, **kwargs)
+
+
+def create(func):
+    evaldict = dict(func.__globals__, _call_=caller, _func_=func)
+    return FunctionMaker.create(
+        func, "return _call_(_func_, %(shortsignature)s)",
+        evaldict, undecorated=func, __wrapped__=func)
+
+
+def uncached(func):
+    meta._compiled.clear()
+    return create(func)
+
+
+def hook(func, *args):
+    pass
+
+
+def check(func, a, b, c):
+    pass
+
+
+def target(a, b, c=None):
+    return a
+
+
+def wrapped(func):
+    @wraps(func)
+    def inner(*args, **kwargs):
+        hook(func, *args, **kwargs)
+        return func(*args, **kwargs)
+    return inner
+
+
+def best(stmt, number, loops=1):
+    return min(repeat(stmt, number=loops, repeat=5)) / number / loops
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark decorating functions.')
+    parser.add_argument('--functions', type=int, default=2000,
+                        help='Functions decorated per timing loop.')
+    parser.add_argument('--calls', type=int, default=200000,
+                        help='Calls per timing loop.')
+    args = parser.parse_args()
+    funcs = functions(args.functions)
+    cases = [
+        ('compile every wrapper', uncached),
+        ('FunctionMaker.create', create),
+        ('flat_decorator', lambda func: flat_decorator(caller, func)),
+    ]
+    base = None
+    for name, decorate in cases:
+        us = best(lambda: [decorate(func) for func in funcs],
+                  len(funcs)) * 10 ** 6
+        base = base or us
+        print('%-22s %8.2f us/function  x%.2f' % (name, us, base / us))
+    print()
+    calls = [
+        ('bare function', target),
+        ('functools.wraps', wrapped(target)),
+        ('flat_decorator', flat_decorator(caller, target)),
+        ('call_through', call_through(target, before=hook)),
+        ('call_through (exact)', call_through(target, before=check)),
+    ]
+    bare = None
+    for name, func in calls:
+        ns = best(lambda: func(1, 2), 1, args.calls) * 10 ** 9
+        bare = bare or ns
+        print('%-22s %8.1f ns/call  +%.1f ns' % (name, ns, ns - bare))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare repeated `xoutil.objects.fdir` calls on a deep class hierarchy
+against the implementation that listed the names with `dir` every time and
+filtered them through a chain of generators.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from xoutil.objects import fdir
+
+
+def hierarchy(depth, width):
+    '''A class with `depth` bases each defining `width` attributes and a
+    method.'''
+    cls = object
+    for level in range(depth):
+        attrs = {str('attr_%d_%d' % (level, i)): i for i in range(width)}
+        attrs[str('method_%d' % level)] = lambda self: None
+        cls = type(str('Level%d' % level), (cls, ), attrs)
+    return cls
+
+
+def legacy_xdir(obj, getter=None, filter=None):
+    getter = getter or getattr
+    attrs = dir(obj)
+    res = ((a, getter(obj, a)) for a in attrs)
+    if filter:
+        res = ((a, v) for a, v in res if filter(a, v))
+    return res
+
+
+def legacy_fdir(obj, getter=None, filter=None):
+    full = legacy_xdir(obj, getter=getter, filter=filter)
+    return (attr for attr, _v in full)
+
+
+def public(attr, value):
+    return not attr.startswith('_')
+
+
+def methods(attr, value):
+    return callable(value) and not attr.startswith('_')
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 6
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark xoutil.objects.fdir.')
+    parser.add_argument('--depth', type=int, default=20,
+                        help='Classes in the hierarchy.')
+    parser.add_argument('--width', type=int, default=15,
+                        help='Attributes per class.')
+    parser.add_argument('--number', type=int, default=2000,
+                        help='Calls per timing loop.')
+    args = parser.parse_args()
+    cls = hierarchy(args.depth, args.width)
+    instance = cls()
+    instance.value = 1
+    for target, obj in (('class', cls), ('instance', instance)):
+        for name, filter in (('public', public), ('methods', methods)):
+            legacy = best(lambda: list(legacy_fdir(obj, filter=filter)),
+                          args.number)
+            cached = best(lambda: list(fdir(obj, filter=filter)), args.number)
+            print('%-8s %-8s legacy: %8.2f us  fdir: %8.2f us  x%.2f' % (
+                target, name, legacy, cached, legacy / cached))
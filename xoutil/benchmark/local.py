@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Measure the per-access overhead of `xoutil._local.local` against a plain
+object and `threading.local`.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from threading import local as thread_local
+from timeit import repeat
+
+from xoutil._local import local
+
+
+class Plain(object):
+    pass
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    from xoutil._local import getcurrent
+    parser = argparse.ArgumentParser('Benchmark xoutil._local.local.')
+    parser.add_argument('--number', type=int, default=200000,
+                        help='Accesses per timing loop.')
+    args = parser.parse_args()
+    print('isolation by %s.%s' % (getcurrent.__module__,
+                                  getcurrent.__name__))
+    for name, cls in (('object', Plain), ('threading.local', thread_local),
+                      ('xoutil._local.local', local)):
+        obj = cls()
+        obj.value = 1
+
+        def write():
+            obj.value = 2
+
+        read = best(lambda: obj.value, args.number)
+        write = best(write, args.number)
+        print('  %-20s read %7.1f ns   write %7.1f ns' % (name, read, write))
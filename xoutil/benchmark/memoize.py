@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Micro-benchmarks of the caches in `xoutil.functools`.
+
+- Key construction by call shape: `_make_key` against `_fast_key`.
+
+- Hit, miss and eviction throughput of `lru_cache` and `memoize`, with one
+  or several threads calling the cached function.
+
+'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from xoutil.functools import lru_cache, memoize
+from xoutil.functools import _make_key, _fast_key
+
+
+SHAPES = [
+    ('single int', (1, ), {}),
+    ('3 scalars', (1, 2.5, 'name'), {}),
+    ('args + kwarg', (1, 2), {'currency': 'USD'}),
+    ('2 kwargs', (1, ), {'currency': 'USD', 'rounded': True}),
+]
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 9
+
+
+def calls(kind, number):
+    '''The arguments of `number` calls that hit, miss or evict the cache of
+    a function with ``maxsize=128``.'''
+    if kind == 'hit':
+        return [i % 64 for i in range(number)]
+    elif kind == 'miss':
+        # With maxsize=None nothing is evicted, so all are distinct.
+        return list(range(number))
+    else:
+        return [i % 256 for i in range(number)]
+
+
+def decorated(name, kind):
+    maxsize = None if kind == 'miss' else 128
+    if name == 'lru_cache':
+        return lru_cache(maxsize=maxsize)(lambda x: x)
+    elif name == 'memoize':
+        return memoize(maxsize=maxsize)(lambda x: x)
+    else:
+        return memoize(maxsize=maxsize, policy='lfu')(lambda x: x)
+
+
+def run(name, kind, number, threads):
+    '''Return the ns per call of `number` calls split among `threads`.'''
+    from multiprocessing.pool import ThreadPool
+    args = calls(kind, number)
+    chunks = [args[i::threads] for i in range(threads)]
+    pool = ThreadPool(threads) if threads > 1 else None
+
+    def stmt():
+        func = decorated(name, kind)
+        if kind == 'hit':
+            for arg in range(64):
+                func(arg)
+        if pool:
+            pool.map(lambda chunk: [func(arg) for arg in chunk], chunks)
+        else:
+            [func(arg) for arg in args]
+
+    try:
+        return best(stmt, 1) / number
+    finally:
+        if pool:
+            pool.close()
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark xoutil.functools caches.')
+    parser.add_argument('--number', type=int, default=100000,
+                        help='Calls per timing loop.')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4],
+                        help='Threads calling the cached function.')
+    args = parser.parse_args()
+    print('Key construction (ns/key)')
+    for shape, a, kw in SHAPES:
+        old = best(lambda: _make_key(a, kw, False), args.number)
+        new = best(lambda: _fast_key(a, kw, False), args.number)
+        print('  %-14s _make_key %7.1f  _fast_key %7.1f  x%.2f' % (
+            shape, old, new, old / new))
+    print('Throughput (ns/call)')
+    for threads in args.threads:
+        for kind in ('hit', 'miss', 'evict'):
+            times = ['%s %7.1f' % (name, run(name, kind, args.number, threads))
+                     for name in ('lru_cache', 'memoize', 'memoize(lfu)')]
+            print('  %d thread(s) %-6s %s' % (threads, kind, '  '.join(times)))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare attribute access through `xoutil.proxy.Proxy` against direct
+access to the target.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+import warnings
+from timeit import repeat
+
+
+class Query(object):
+    def __init__(self):
+        self.value = 1
+
+    def filter(self):
+        return self
+
+
+class Ordering(object):
+    def order_by(self):
+        return self
+
+
+def proxified():
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        from xoutil.proxy import proxify
+
+        @proxify
+        class Proxified(object):
+            behaves = [Ordering]
+
+            def __init__(self, target):
+                self.target = target
+
+    return Proxified
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark xoutil.proxy.')
+    parser.add_argument('--number', type=int, default=100000,
+                        help='Accesses per timing loop.')
+    args = parser.parse_args()
+    query = Query()
+    proxy = proxified()(query)
+    ordering = Ordering()
+    cases = [
+        ('attribute', lambda: query.value, lambda: proxy.value),
+        ('target method', lambda: query.filter(), lambda: proxy.filter()),
+        ('behavior method', lambda: ordering.order_by(),
+         lambda: proxy.order_by()),
+    ]
+    for name, direct, proxied in cases:
+        base = best(direct, args.number)
+        ns = best(proxied, args.number)
+        print('%-16s direct: %7.1f ns  proxy: %8.1f ns  x%.1f' % (
+            name, base, ns, ns / base))
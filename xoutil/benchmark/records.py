@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare `xoutil.records.datetime_reader` against a plain `strptime`
+reader.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from datetime import datetime, timedelta
+from timeit import repeat
+
+from xoutil.records import datetime_reader
+
+
+def strptime_reader(format):
+    def reader(val):
+        return datetime.strptime(val, format)
+    return reader
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=1, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark datetime readers.')
+    parser.add_argument('--size', type=int, default=10000,
+                        help='Values per timing loop.')
+    parser.add_argument('--distinct', type=int, default=30,
+                        help='Distinct dates among the values.')
+    args = parser.parse_args()
+    start = datetime(2015, 1, 1, 8, 30)
+    for fmt in ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S'):
+        values = [(start + timedelta(days=i % args.distinct)).strftime(fmt)
+                  for i in range(args.size)]
+        cases = [
+            ('strptime', strptime_reader(fmt)),
+            ('datetime_reader', datetime_reader(fmt)),
+            ('datetime_reader (cache)',
+             datetime_reader(fmt, cache=args.distinct)),
+        ]
+        base = None
+        print(fmt)
+        for name, reader in cases:
+            ns = best(lambda: [reader(val) for val in values], args.size)
+            base = base or ns
+            print('  %-24s %8.1f ns/value  x%.2f' % (name, ns, base / ns))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare `xoutil.types.is_scalar`, `is_iterable` and `is_collection`
+against the implementations that probed every value, alone and inside
+`xoutil.iterators.flatten`.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from xoutil.iterators import flatten
+from xoutil.types import is_scalar, is_iterable, is_collection
+
+
+def legacy_is_iterable(maybe):
+    try:
+        iter(maybe)
+    except:
+        return False
+    else:
+        return True
+
+
+def legacy_is_string_like(maybe):
+    try:
+        maybe + ""
+    except TypeError:
+        return False
+    else:
+        return True
+
+
+def legacy_is_scalar(maybe):
+    return legacy_is_string_like(maybe) or not legacy_is_iterable(maybe)
+
+
+def legacy_is_collection(maybe):
+    from xoutil.collections import UserList
+    from six.moves import range
+    from types import GeneratorType
+    return isinstance(maybe, (tuple, range, list, set, frozenset,
+                              GeneratorType, UserList))
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=1, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark xoutil.types predicates.')
+    parser.add_argument('--size', type=int, default=100000,
+                        help='Values per timing loop.')
+    args = parser.parse_args()
+    values = [i if i % 3 else 'name %d' % i for i in range(args.size)]
+    nested = [values[i:i + 10] for i in range(0, args.size, 10)]
+    cases = [
+        ('is_scalar', legacy_is_scalar, is_scalar),
+        ('is_iterable', legacy_is_iterable, is_iterable),
+        ('is_collection', legacy_is_collection, is_collection),
+    ]
+    for name, legacy, current in cases:
+        old = best(lambda: [legacy(val) for val in values], len(values))
+        new = best(lambda: [current(val) for val in values], len(values))
+        print('%-16s legacy: %7.1f ns  now: %7.1f ns  x%.2f' % (
+            name, old, new, old / new))
+    old = best(lambda: list(flatten(nested, is_scalar=legacy_is_scalar)),
+               len(values))
+    new = best(lambda: list(flatten(nested)), len(values))
+    print('%-16s legacy: %7.1f ns  now: %7.1f ns  x%.2f' % (
+        'flatten', old, new, old / new))
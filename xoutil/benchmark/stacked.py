@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare the flattened look-up of `xoutil.collections.StackedDict` (and
+so `xoutil.context.Context`) against the underlying `ChainMap` at several
+depths.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from xoutil.collections import StackedDict
+
+
+def stacked(depth):
+    '''A stacked dict with `depth` levels; the key 'base' is only found in
+    the bottom one.'''
+    res = StackedDict(base=0)
+    for level in range(1, depth):
+        res.push(**{'key%d' % level: level})
+    return res
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark StackedDict look-ups.')
+    parser.add_argument('--number', type=int, default=100000,
+                        help='Calls per timing loop.')
+    parser.add_argument('--depths', type=int, nargs='+',
+                        default=[1, 4, 16, 64],
+                        help='Levels in the stacked dict.')
+    args = parser.parse_args()
+    print('%6s %-10s %12s %12s %8s' % ('depth', 'operation', 'ChainMap',
+                                       'StackedDict', 'speedup'))
+    for depth in args.depths:
+        sd = stacked(depth)
+        chain = sd.inner
+        cases = [
+            ('getitem', lambda: chain['base'], lambda: sd['base']),
+            ('contains', lambda: 'base' in chain, lambda: 'base' in sd),
+            ('len', lambda: len(chain), lambda: len(sd)),
+        ]
+        for name, legacy, flat in cases:
+            number = args.number if name != 'len' else args.number // depth
+            old, new = best(legacy, number), best(flat, number)
+            print('%6d %-10s %9.1f ns %9.1f ns   x%.2f' % (depth, name, old,
+                                                           new, old / new))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2015 Merchise Autrement and Contributors
+
+'''Compare compiled `xoutil.objects.traverse` against the per-call
+split-and-pop implementation it replaced.'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_imports)
+
+from timeit import repeat
+
+from xoutil import Unset
+from xoutil.objects import smart_getter, traverse, get_traverser
+from xoutil.objects import traverse_columns
+
+
+def legacy_traverse(obj, path, default=Unset, sep='.'):
+    getter = lambda o, a, default=None: smart_getter(o)(a, default)
+    found = object()
+    current = obj
+    attrs = path.split(sep)
+    while current is not found and attrs:
+        attr = attrs.pop(0)
+        current = getter(current, attr, found)
+    if current is found:
+        if default is Unset:
+            raise AttributeError(attr)
+        else:
+            return default
+    else:
+        return current
+
+
+class Obj(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+request = Obj(session=Obj(user={'id': 1, 'name': 'John'}))
+PATH = 'session.user.id'
+PATHS = ('session.user.id', 'session.user.name')
+
+
+def best(stmt, number):
+    return min(repeat(stmt, number=number, repeat=5)) / number * 10 ** 9
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser('Benchmark xoutil.objects.traverse.')
+    parser.add_argument('--number', type=int, default=100000,
+                        help='Calls per timing loop.')
+    parser.add_argument('--rows', type=int, default=1000,
+                        help='Objects per batch in the batch benchmarks.')
+    args = parser.parse_args()
+    compiled = get_traverser(PATH)
+    rows = [request] * args.rows
+    rows_traverser = get_traverser(*PATHS)
+    cases = [
+        ('legacy traverse', lambda: legacy_traverse(request, PATH)),
+        ('traverse', lambda: traverse(request, PATH)),
+        ('get_traverser (prebuilt)', lambda: compiled(request)),
+    ]
+    base = None
+    for name, stmt in cases:
+        ns = best(stmt, args.number)
+        base = base or ns
+        print('%-26s %8.1f ns/call  x%.2f' % (name, ns, base / ns))
+    batches = [
+        ('tuple per row', lambda: [rows_traverser(row) for row in rows]),
+        ('traverse_columns', lambda: traverse_columns(rows, *PATHS)),
+    ]
+    base = None
+    number = max(args.number // args.rows, 1)
+    for name, stmt in batches:
+        ns = best(stmt, number) / args.rows
+        base = base or ns
+        print('%-26s %8.1f ns/row   x%.2f' % (name, ns, base / ns))
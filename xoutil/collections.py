@@ -59,6 +59,7 @@ del _pm, _copy_python_module_members
 from collections import defaultdict as _defaultdict
 from xoutil.names import strlist as slist
 from xoutil.objects import SafeDataItem as safe
+from xoutil.functools import lru_cache as _lru_cache
 
 
 import sys
@@ -172,32 +173,77 @@ class OpenDictMixin(object):
 
     def __getattr__(self, name):
         from xoutil import Unset
-        from xoutil.inspect import get_attr_value
-        res = get_attr_value(self, name, Unset)
-        if res is not Unset:
-            return res
+        # Only names defined in the class may be found statically (e.g. an
+        # unset slot), look-up the keys directly for the others.
+        if any(name in cls.__dict__ for cls in type(self).__mro__):
+            from xoutil.inspect import get_attr_value
+            res = get_attr_value(self, name, Unset)
+            if res is not Unset:
+                return res
+        key = (~self).get(name)
+        if key:
+            return self[key]
         else:
-            key = (~self).get(name)
-            if key:
-                return self[key]
-            else:
-                msg = "'%s' object has no attribute '%s'"
-                raise AttributeError(msg % (type(self).__name__, name))
+            msg = "'%s' object has no attribute '%s'"
+            raise AttributeError(msg % (type(self).__name__, name))
 
     def __setattr__(self, name, value):
-        key = (~self).get(name)
+        key = None if _is_slot(type(self), name) else (~self).get(name)
         if key:
             self[key] = value
         else:
             super(OpenDictMixin, self).__setattr__(name, value)
 
     def __delattr__(self, name):
-        key = (~self).get(name)
+        key = None if _is_slot(type(self), name) else (~self).get(name)
         if key:
             del self[key]
         else:
             super(OpenDictMixin, self).__delattr__(name)
 
+    def __setitem__(self, key, value):
+        cache = self._live_index()
+        super(OpenDictMixin, self).__setitem__(key, value)
+        if cache is not None:
+            self._reindex(cache, key)
+
+    def __delitem__(self, key):
+        cache = self._live_index()
+        super(OpenDictMixin, self).__delitem__(key)
+        if cache is not None:
+            self._reindex(cache, key)
+
+    def setdefault(self, key, *default):
+        cache = self._live_index()
+        res = super(OpenDictMixin, self).setdefault(key, *default)
+        if cache is not None:
+            self._reindex(cache, key)
+        return res
+
+    def pop(self, key, *default):
+        cache = self._live_index()
+        res = super(OpenDictMixin, self).pop(key, *default)
+        if cache is not None:
+            self._reindex(cache, key)
+        return res
+
+    def popitem(self):
+        cache = self._live_index()
+        key, value = super(OpenDictMixin, self).popitem()
+        if cache is not None:
+            self._reindex(cache, key)
+        return key, value
+
+    def update(self, *args, **kwargs):
+        cache = self._live_index()
+        super(OpenDictMixin, self).update(*args, **kwargs)
+        if cache is not None and cache[_INDEX_LENGTH] != len(self):
+            cache.clear()
+
+    def clear(self):
+        super(OpenDictMixin, self).clear()
+        self._index_cache().clear()
+
     def __invert__(self):
         '''Return an inverted mapping between key and attribute names (keys of
         the resulting dictionary are identifiers for attribute names and values
@@ -211,25 +257,86 @@ class OpenDictMixin(object):
 
         To obtain this mapping you can use as the unary operator "~".
 
+        .. versionchanged:: 1.7.0 The mapping is built once and then updated
+           when single items are set or deleted.
+
+        '''
+        cache = self._index_cache()
+        if cache.get(_INDEX_LENGTH) != len(self):
+            keys = {key: self._key2identifier(key) for key in self}
+            mapping, shadowed = {}, {}
+            for key, attr in keys.items():
+                if attr:
+                    if attr in mapping:
+                        shadowed.setdefault(attr, []).append(key)
+                    else:
+                        mapping[attr] = key
+            cache[_INDEX_LENGTH] = len(self)
+            cache[_INDEX_KEYS] = keys
+            cache[_INDEX_MAPPING] = mapping
+            cache[_INDEX_SHADOWED] = shadowed
+        return cache[_INDEX_MAPPING]
+
+    def _index_cache(self):
+        '''Return the dict stored in the `__cache_name__` safe field.'''
+        try:
+            # The inner name used by `SafeDataItem` avoids `getattr_static`
+            # once the field is initialized.
+            inner = _index_slots[type(self).__cache_name__]
+            return object.__getattribute__(self, inner)
+        except (KeyError, AttributeError):
+            name = type(self).__cache_name__
+            field = getattr(type(self), name, None)
+            _index_slots[name] = getattr(field, 'inner_name', name)
+            return getattr(self, name)
+
+    def _live_index(self):
+        '''Return the index cache if it matches the current keys.
+
+        Otherwise the cache is dropped (the next `~self` rebuilds it) and None
+        is returned.  Nothing is checked while the index was never built.
+
         '''
-        from xoutil.inspect import get_attr_value
-        KEY_LENGTH = 'length'
-        KEY_MAPPING = 'mapping'
-        cache = get_attr_value(self, type(self).__cache_name__)
-        cached_length = cache.setdefault(KEY_LENGTH, 0)
-        length = len(self)
-        if cached_length != length:
-            cache[KEY_LENGTH] = length
-            aux = ((self._key2identifier(k), k) for k in self)
-            res = {key: attr for key, attr in aux if key}
-            cache[KEY_MAPPING] = res
+        try:
+            # `_index_cache` inlined: every write calls this.
+            inner = _index_slots[type(self).__cache_name__]
+            cache = object.__getattribute__(self, inner)
+        except (KeyError, AttributeError):
+            cache = self._index_cache()
+        if not cache:
+            return None
+        elif cache[_INDEX_LENGTH] == len(self):
+            return cache
         else:
-            res = cache.get(KEY_MAPPING)
-            if res is None:
-                assert cached_length == 0
-                res = {}
-                cache[KEY_MAPPING] = res
-        return res
+            cache.clear()
+            return None
+
+    def _reindex(self, cache, key):
+        '''Update a live index `cache` after `key` was added or removed.'''
+        keys, mapping = cache[_INDEX_KEYS], cache[_INDEX_MAPPING]
+        shadowed = cache[_INDEX_SHADOWED]
+        if key in self:
+            if key not in keys:
+                attr = keys[key] = self._key2identifier(key)
+                if attr:
+                    if attr in mapping:
+                        shadowed.setdefault(attr, []).append(key)
+                    else:
+                        mapping[attr] = key
+        elif key in keys:
+            attr = keys.pop(key)
+            if attr:
+                others = shadowed.get(attr)
+                if mapping[attr] == key:
+                    if others:
+                        mapping[attr] = others.pop(0)
+                    else:
+                        del mapping[attr]
+                else:
+                    others.remove(key)
+                if others == []:
+                    del shadowed[attr]
+        cache[_INDEX_LENGTH] = len(self)
 
     @staticmethod
     def _key2identifier(key):
@@ -239,9 +346,34 @@ class OpenDictMixin(object):
         This function must return a valid identifier or None if the conversion
         is not possible.
 
+        .. versionchanged:: 1.7.0 Results are memoized.
+
         '''
-        from xoutil.string import normalize_slug
-        return normalize_slug(key, '_')
+        return _slug_identifier(key)
+
+
+def _is_slot(cls, name):
+    '''Return True if `name` is a data descriptor (e.g. a slot) of `cls`.'''
+    from xoutil.inspect import isdatadescriptor
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return isdatadescriptor(base.__dict__[name])
+    return False
+
+
+_INDEX_LENGTH = 'length'
+_INDEX_MAPPING = 'mapping'
+_INDEX_KEYS = 'keys'
+_INDEX_SHADOWED = 'shadowed'
+
+# The inner names of the index fields: ``{__cache_name__: inner_name}``.
+_index_slots = {}
+
+
+@_lru_cache(maxsize=1024, typed=True)
+def _slug_identifier(key):
+    from xoutil.string import normalize_slug
+    return normalize_slug(key, '_')
 
 
 class SmartDictMixin(object):
@@ -1493,12 +1625,22 @@ class StackedDict(OpenDictMixin, SmartDictMixin, MutableMapping):
 
     .. versionchanged:: 1.5.2 Based on the newly introduced :class:`ChainMap`.
 
+    .. versionchanged:: 1.7.0 Reads use a flattened dict of the visible
+       values, so they don't depend on the number of levels.  Levels count
+       their changes, so changing them directly in ``inner.maps`` is seen;
+       but if `inner` is replaced by a `ChainMap` of other mappings, reads go
+       through it.
+
     '''
     __slots__ = (safe.slot('inner', ChainMap),
-                 safe.slot(OpenDictMixin.__cache_name__, dict))
+                 safe.slot(OpenDictMixin.__cache_name__, dict),
+                 str('_clock'), str('_flat'), str('_stamp'))
 
     def __init__(self, *args, **kwargs):
         # Each data item is stored as {key: {level: value, ...}}
+        self._clock = [0]
+        self._flat = self._stamp = None
+        self.inner = ChainMap(_Level(self._clock))
         self.update(*args, **kwargs)
 
     @property
@@ -1523,7 +1665,10 @@ class StackedDict(OpenDictMixin, SmartDictMixin, MutableMapping):
         :returns: The pushed :attr:`level` number.
 
         '''
-        self.inner = self.inner.new_child()
+        flat = self._valid_flat()
+        self.inner = self.inner.new_child(_Level(self._clock))
+        if flat is not None:
+            self._stamp_flat()
         self.update(*args, **kwargs)
         return self.level
 
@@ -1536,10 +1681,19 @@ class StackedDict(OpenDictMixin, SmartDictMixin, MutableMapping):
 
         '''
         if self.level > 0:
+            cache = self._live_index()
+            flat = self._valid_flat()
             stack = self.inner
             res = stack.maps[0]
             self.inner = stack.parents
-            return res
+            if flat is not None:
+                for key in res:
+                    self._resolve(flat, key)
+                self._stamp_flat()
+            if cache is not None:
+                for key in res:
+                    self._reindex(cache, key)
+            return dict(res)
         else:
             raise TypeError('Cannot pop from StackedDict without any levels')
 
@@ -1568,19 +1722,222 @@ class StackedDict(OpenDictMixin, SmartDictMixin, MutableMapping):
         return '%s(%s)' % (type(self).__name__, str(self))
 
     def __len__(self):
-        return len(self.inner)
+        flat = self._flattened()
+        return len(flat if flat is not None else
+                   set().union(*self.inner.maps))
 
     def __iter__(self):
-        return iter(self.inner)
+        flat = self._flattened()
+        # A snapshot, so keys may be deleted while iterating.
+        return iter(list(flat) if flat is not None else
+                    set().union(*self.inner.maps))
+
+    def __contains__(self, key):
+        flat = self._flattened()
+        return key in (flat if flat is not None else self.inner)
 
     def __getitem__(self, key):
-        return self.inner[key]
+        flat = self._flattened()
+        return (flat if flat is not None else self.inner)[key]
 
     def __setitem__(self, key, value):
-        self.inner[key] = value
+        cache = self._live_index()
+        flat = self._valid_flat()
+        if flat is not None:
+            # Not `_Level.__setitem__`, that would make `flat` stale.
+            dict.__setitem__(self._stamp[1][0], key, value)
+            flat[key] = value
+        else:
+            self.inner[key] = value
+        if cache is not None:
+            self._reindex(cache, key)
 
     def __delitem__(self, key):
+        cache = self._live_index()
+        flat = self._valid_flat()
         del self.inner[key]
+        if flat is not None:
+            self._resolve(flat, key)
+            self._stamp_flat()
+        if cache is not None:
+            self._reindex(cache, key)
+
+    def _flattened(self):
+        '''Return the dict with the visible value of each key.
+
+        It's built on the first read and then kept up to date by writes,
+        :meth:`push` and :meth:`pop`.  Return None if the levels are not
+        `_Level`:class: objects of this stacked dict (their changes can't be
+        noticed).
+
+        '''
+        # `_valid_flat` inlined: every read calls this.
+        stamp = self._stamp
+        if stamp is not None:
+            inner, maps, depth, version = stamp
+            current = object.__getattribute__(self, _STACKED_INNER)
+            if (inner is current and maps is current.maps and
+                    depth == len(maps) and version == self._clock[0]):
+                return self._flat
+        self._flat = self._stamp = None
+        clock = self._clock
+        maps = self.inner.maps
+        if all(type(level) is _Level and level.clock is clock
+               for level in maps):
+            res = {}
+            for level in reversed(maps):
+                res.update(level)
+            self._flat = res
+            self._stamp_flat()
+            return res
+        else:
+            return None
+
+    def _valid_flat(self):
+        '''Return the flattened dict if it's still valid, otherwise drop it
+        and return None.'''
+        stamp = self._stamp
+        if stamp is not None:
+            inner, maps, depth, version = stamp
+            current = object.__getattribute__(self, _STACKED_INNER)
+            if (inner is current and maps is current.maps and
+                    depth == len(maps) and version == self._clock[0]):
+                return self._flat
+            self._flat = self._stamp = None
+        return None
+
+    def _stamp_flat(self):
+        '''Mark the flattened dict as matching the current levels.'''
+        inner = self.inner
+        maps = inner.maps
+        self._stamp = (inner, maps, len(maps), self._clock[0])
+
+    def _resolve(self, flat, key):
+        '''Update `key` in `flat` after it was removed from a level.'''
+        for level in self.inner.maps:
+            if key in level:
+                flat[key] = level[key]
+                break
+        else:
+            flat.pop(key, None)
+
+
+# The slot behind `StackedDict.inner`.
+_STACKED_INNER = StackedDict.inner.inner_name
+
+
+class _Level(dict):
+    '''A level of a `StackedDict`:class:.
+
+    Every change increases the version in `clock` (a list shared by the
+    levels of the stacked dict), so it knows when its flattened dict is
+    stale.
+
+    '''
+    __slots__ = (str('clock'), )
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def __setitem__(self, key, value):
+        self.clock[0] += 1
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.clock[0] += 1
+        dict.__delitem__(self, key)
+
+    def setdefault(self, key, default=None):
+        self.clock[0] += 1
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        self.clock[0] += 1
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self.clock[0] += 1
+        return dict.popitem(self)
+
+    def update(self, *args, **kwargs):
+        self.clock[0] += 1
+        dict.update(self, *args, **kwargs)
+
+    def clear(self):
+        self.clock[0] += 1
+        dict.clear(self)
+
+    if hasattr(dict, '__ior__'):
+        def __ior__(self, other):
+            self.clock[0] += 1
+            return dict.__ior__(self, other)
+
+
+class MergedView(Mapping):
+    '''A read-only view of the merge of several mappings.
+
+    Keys are resolved with the same rules of `xoutil.objects.dict_merge`:func:
+    but only when accessed, and nothing is copied: values found in a single
+    mapping are returned as they are, and nested mappings are returned as
+    (nested) merged views::
+
+        >>> base = {'db': {'host': 'localhost', 'port': 5432}, 'apps': ['a']}
+        >>> local = {'db': {'host': 'db.local'}, 'apps': ['b']}
+        >>> view = MergedView(base, local)
+        >>> view['db']['host']
+        'db.local'
+        >>> view['db']['port']
+        5432
+        >>> view['apps']
+        ['a', 'b']
+
+    Since the mappings are taken by reference, changes to them are reflected
+    in the view.  Use `~xoutil.objects.dict_merge`:func: to get a dict.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    __slots__ = (str('maps'), )
+
+    def __init__(self, *maps, **kwargs):
+        if kwargs:
+            maps = maps + (kwargs, )
+        self.maps = maps
+
+    def __getitem__(self, key):
+        from xoutil.objects import _merge_values
+        values = []
+        for m in self.maps:
+            if key in m:
+                val = m[key]
+                # Like `dict_merge`, the same object twice is not joined.
+                if len(values) != 1 or values[0] is not val:
+                    values.append(val)
+        if not values:
+            raise KeyError(key)
+        elif len(values) == 1:
+            res = values[0]
+            return MergedView(res) if isinstance(res, Mapping) else res
+        else:
+            return _merge_values(key, values, lambda vals: MergedView(*vals))
+
+    def __contains__(self, key):
+        return any(key in m for m in self.maps)
+
+    def __iter__(self):
+        seen = set()
+        for m in self.maps:
+            for key in m:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set().union(*self.maps))
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__,
+                           ', '.join(repr(m) for m in self.maps))
 
 
 class OrderedSmartDict(SmartDictMixin, OrderedDict):
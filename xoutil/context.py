@@ -35,7 +35,8 @@ from xoutil.objects import metaclass
 from xoutil.collections import StackedDict
 
 from xoutil.names import strlist as strs
-__all__ = strs('Context', 'context', 'NulContext')
+__all__ = strs('Context', 'context', 'NulContext', 'ThreadLocalStorage',
+               'ContextVarStorage', 'set_storage')
 del strs
 
 
@@ -44,18 +45,119 @@ class LocalData(_local):
         super(LocalData, self).__init__()
         self.contexts = {}
 
-_data = LocalData()
+
+class ThreadLocalStorage(object):
+    '''Keep the entered contexts of each thread (or greenlet).
+
+    This is the default storage.  A new thread (or greenlet) starts with no
+    contexts at all.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    def __init__(self):
+        self._data = LocalData()
+
+    @property
+    def contexts(self):
+        '''The mapping from names to the entered contexts.'''
+        return self._data.contexts
+
+    def owner(self):
+        return None
+
+    def register(self, context):
+        self._data.contexts[context.name] = context
+
+    def unregister(self, context):
+        del self._data.contexts[context.name]
+
+
+class ContextVarStorage(object):
+    '''Keep the entered contexts in a `contextvars.ContextVar`.
+
+    Every `asyncio`:mod: task sees the contexts entered where it was created
+    (the mapping is copied on write, so spawning a task is cheap) and the
+    contexts it enters are not seen by the others.  Entering in a task a
+    context inherited from another task creates a new context whose bottom
+    level is a copy of the inherited data.
+
+    Requires Python 3.7 or later.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    def __init__(self):
+        from contextvars import ContextVar
+        from asyncio import current_task
+        self._var = ContextVar(str('xoutil.context'), default={})
+        self._current_task = current_task
+
+    @property
+    def contexts(self):
+        '''The mapping from names to the entered contexts.
+
+        It must not be changed.
+
+        '''
+        return self._var.get()
+
+    def owner(self):
+        '''Return the running task (or greenlet or thread).'''
+        from xoutil._local import getcurrent
+        try:
+            res = self._current_task()
+        except RuntimeError:    # No running loop
+            res = None
+        return res if res is not None else getcurrent()
+
+    def register(self, context):
+        contexts = dict(self._var.get())
+        context._shadowed = contexts.get(context.name)
+        contexts[context.name] = context
+        self._var.set(contexts)
+
+    def unregister(self, context):
+        contexts = dict(self._var.get())
+        if context._shadowed is None:
+            del contexts[context.name]
+        else:
+            contexts[context.name] = context._shadowed
+            context._shadowed = None
+        self._var.set(contexts)
+
+
+_storage = ThreadLocalStorage()
+
+
+def set_storage(storage):
+    '''Set where the entered contexts are kept.
+
+    :param storage: Either a `ThreadLocalStorage`:class: or a
+                    `ContextVarStorage`:class: instance.
+
+    :returns: The previous storage.
+
+    This should be done before any context is entered, contexts entered in
+    the previous storage are not seen in the new one.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    global _storage
+    res, _storage = _storage, storage
+    return res
 
 
 class MetaContext(type(StackedDict)):
     def __len__(self):
-        return len(_data.contexts)
+        return len(_storage.contexts)
 
     def __iter__(self):
-        return iter(_data.contexts)
+        return iter(_storage.contexts)
 
     def __getitem__(self, name):
-        return _data.contexts.get(name, _null_context)
+        return _storage.contexts.get(name, _null_context)
 
     def __contains__(self, name):
         '''Basic support for the 'A in context' idiom.'''
@@ -115,17 +217,23 @@ class Context(metaclass(MetaContext), StackedDict):
         RuntimeError: Entering the same context level twice! ...
 
     '''
-    __slots__ = ('name', 'count', '_events')
+    __slots__ = ('name', 'count', '_events', '_owner', '_shadowed')
 
     def __new__(cls, name, **data):
         self = cls[name]
-        if not self:     # if self is _null_context:
+        owner = _storage.owner()
+        if not self or self._owner is not owner:
+            inherited = self
             self = super(Context, cls).__new__(cls)
             super(Context, self).__init__()
+            if inherited:
+                self.update(inherited)
             self.name = name
             self.count = 0
             # TODO: Redefine all event management
             self._events = []
+            self._owner = owner
+            self._shadowed = None
         self.push(**data)
         return self
 
@@ -138,7 +246,7 @@ class Context(metaclass(MetaContext), StackedDict):
 
     def __enter__(self):
         if self.count == 0:
-            _data.contexts[self.name] = self
+            _storage.register(self)
         self.count += 1
         if self.count == self.level:
             return self
@@ -151,7 +259,7 @@ class Context(metaclass(MetaContext), StackedDict):
         if self.count == 0:
             for event in self.events:
                 event(self)
-            del _data.contexts[self.name]
+            _storage.unregister(self)
         self.pop()
         return False
 
@@ -68,6 +68,7 @@ from functools import wraps, partial
 from types import FunctionType as function
 
 from six import string_types as _str_base, PY3 as _PY3
+from six import get_function_globals as _get_globals
 
 
 if _PY3:
@@ -77,13 +78,31 @@ else:
 
 
 from xoutil.names import strlist as strs
-__all__ = strs('FunctionMaker', 'flat_decorator', 'decorator')
+__all__ = strs('FunctionMaker', 'flat_decorator', 'call_through',
+               'decorator')
 del strs
 
 
 DEF = re.compile('\s*def\s*([_\w][_\w\d]*)\s*\(')
 
 
+# Compiled templates.  Keyed by the expanded source in `FunctionMaker.make`,
+# and by the signature in `FunctionMaker.call_through`.  Decorating a function
+# with an already seen signature reuses the code object instead of compiling
+# the source again.
+_compiled = {}
+_MAX_COMPILED = 4096
+
+
+def _compile(key, src, filename='<string>'):
+    code = _compiled.get(key)
+    if code is None:
+        if len(_compiled) >= _MAX_COMPILED:
+            _compiled.clear()
+        code = _compiled[key] = compile(src, filename, 'exec')
+    return code
+
+
 # basic functionality
 class FunctionMaker(object):
     """
@@ -144,7 +163,7 @@ class FunctionMaker(object):
         func.__name__ = self.name
         func.__doc__ = getattr(self, 'doc', None)
         func.__dict__ = getattr(self, 'dict', {})
-        func.func_defaults = getattr(self, 'defaults', ())
+        func.__defaults__ = getattr(self, 'defaults', ())
         func.__kwdefaults__ = getattr(self, 'kwonlydefaults', None)
         callermodule = sys._getframe(3).f_globals.get('__name__', '?')
         func.__module__ = getattr(self, 'module', callermodule)
@@ -166,12 +185,10 @@ class FunctionMaker(object):
         if not src.endswith('\n'):  # add a newline just for safety
             src += '\n'   # this is needed in old versions of Python
         try:
-            code = compile(src, '<string>', 'single')
-            # print >> sys.stderr, 'Compiling %s' % src
-            eval(code, evaldict, evaldict)
+            eval(_compile(src, src), evaldict, evaldict)
         except:
-            print >> sys.stderr, 'Error in generated code:'
-            print >> sys.stderr, src
+            print('Error in generated code:', file=sys.stderr)
+            print(src, file=sys.stderr)
             raise
         func = evaldict[name]
         if addsource:
@@ -203,6 +220,172 @@ class FunctionMaker(object):
         return self.make('def %(name)s(%(signature)s):\n' + ibody,
                          evaldict, addsource, **attrs)
 
+    @classmethod
+    def wrap(cls, func, caller, addsource=True, **attrs):
+        """
+        Create a function with the signature of `func` that returns
+        ``caller(func, <its arguments>)``.
+
+        This is the same function ``create(func, "return _call_(_func_,
+        %(shortsignature)s)", ...)`` makes, but without evaluating any source:
+        the code object is compiled once per signature and the function is
+        built with `types.FunctionType`, binding `caller` and `func` as
+        closures.  Return None if `func` is not a function whose signature
+        can be reproduced this way.
+
+        .. versionadded:: 1.7.0
+
+        """
+        return _call_through(func, 'call', caller, None, None, addsource,
+                             attrs)
+
+
+# The bodies of the call-through wrappers.  `forward` passes the arguments
+# exactly as the signature receives them.
+_BODIES = {
+    'call': 'return _call_(_func_, %(forward)s)',
+    'before': '_before_(_func_, %(forward)s)\n'
+              '    return _func_(%(forward)s)',
+    'after': 'return _after_(_func_, _func_(%(forward)s))',
+    'both': '_before_(_func_, %(forward)s)\n'
+            '    return _after_(_func_, _func_(%(forward)s))',
+}
+
+_RESERVED = ('_func_', '_call_', '_before_', '_after_')
+
+_CALL_THROUGH = """\
+def _factory_(_func_, _call_, _before_, _after_):
+    def _wrapper_(%(signature)s):
+        %(body)s
+    _wrapper_.__source__ = %(source)r
+    return _wrapper_
+"""
+
+
+def _call_through(func, kind, caller, before, after, addsource, attrs):
+    factory = _call_through_factory(func, kind)
+    if factory is None:
+        return None
+    template = factory(func, caller, before, after)
+    code = template.__code__
+    name = func.__name__
+    if name == '<lambda>':
+        name = str('_lambda_')
+    if hasattr(code, 'replace'):
+        code = code.replace(co_name=name)
+    res = function(code, _get_globals(func), name, func.__defaults__,
+                   template.__closure__)
+    res.__doc__ = func.__doc__
+    res.__dict__ = func.__dict__.copy()
+    res.__module__ = func.__module__
+    res.__kwdefaults__ = getattr(func, '__kwdefaults__', None)
+    if hasattr(func, '__annotations__'):
+        res.__annotations__ = dict(func.__annotations__)
+    if hasattr(func, '__qualname__'):
+        res.__qualname__ = func.__qualname__
+    if addsource:
+        attrs['__source__'] = template.__source__.replace('_wrapper_', name,
+                                                          1)
+    res.__dict__.update(attrs)
+    return res
+
+
+def _call_through_factory(func, kind):
+    """Return the factory of `kind` call-through wrappers for the signature
+    of `func` or None."""
+    if not inspect.isfunction(func):
+        return None
+    spec = _getfullargspec(func)
+    args = list(spec.args)
+    if not all(isinstance(arg, _str_base) for arg in args):
+        return None    # exotic signature, valid only in Python 2.X
+    kwonly = getattr(spec, 'kwonlyargs', None) or []
+    varkw = getattr(spec, 'varkw', None) or getattr(spec, 'keywords', None)
+    names = args + kwonly + [spec.varargs, varkw]
+    if any(name in names for name in _RESERVED):
+        return None
+    signature, forward = list(args), list(args)
+    if spec.varargs:
+        signature.append('*' + spec.varargs)
+        forward.append('*' + spec.varargs)
+    elif kwonly:
+        signature.append('*')
+    signature.extend(kwonly)
+    forward.extend('%s=%s' % (arg, arg) for arg in kwonly)
+    if varkw:
+        signature.append('**' + varkw)
+        forward.append('**' + varkw)
+    key = (kind, ', '.join(signature), ', '.join(forward))
+    factory = _compiled.get(key)
+    if factory is None:
+        body = _BODIES[kind] % dict(forward=key[2])
+        source = 'def _wrapper_(%s):\n    %s\n' % (key[1], body)
+        src = _CALL_THROUGH % dict(signature=key[1],
+                                   body=body.replace('\n', '\n    '),
+                                   source=str(source))
+        evaldict = {}
+        eval(_compile(src, src, '<call-through>'), evaldict)
+        factory = _compiled[key] = evaldict['_factory_']
+    return factory
+
+
+def call_through(func=None, before=None, after=None):
+    """
+    Wrap `func` in a function with its exact signature that calls `func`
+    directly.
+
+    The wrapper passes its arguments on as it receives them: positional
+    parameters are not packed into a tuple, nor keyword parameters into a
+    dict, unless `func` itself takes ``*args`` or ``**kwargs``.  So, unlike
+    with `flat_decorator`:func:, calling the wrapper costs a single
+    additional frame, plus the hooks:
+
+    - ``before(func, <arguments>)`` is called before `func`;
+
+    - ``after(func, result)`` is called after `func` and its value is
+      returned instead of `func`'s.
+
+    Without hooks `func` is returned unchanged.  If `func` is not given,
+    return a decorator::
+
+        >>> def log(func, *args):
+        ...     print('%s%r' % (func.__name__, args))
+
+        >>> @call_through(before=log)
+        ... def add(a, b=1):
+        ...     return a + b
+
+        >>> add(2)
+        add(2, 1)
+        3
+
+    Functions that can't be wrapped this way (names in the signature that
+    clash with the generated code, callables that are not functions) are
+    wrapped with `functools.wraps`:func:.
+
+    .. versionadded:: 1.7.0
+
+    """
+    if func is None:
+        return partial(call_through, before=before, after=after)
+    if before is not None:
+        kind = 'both' if after is not None else 'before'
+    elif after is not None:
+        kind = 'after'
+    else:
+        return func
+    attrs = dict(undecorated=func, __wrapped__=func)
+    res = _call_through(func, kind, None, before, after, True, attrs)
+    if res is None:
+        @wraps(func)
+        def res(*args, **kwargs):
+            if before is not None:
+                before(func, *args, **kwargs)
+            result = func(*args, **kwargs)
+            return after(func, result) if after is not None else result
+        res.undecorated = res.__wrapped__ = func
+    return res
+
 
 def flat_decorator(caller, func=None):
     """
@@ -213,7 +396,11 @@ def flat_decorator(caller, func=None):
     ``decorator(caller, func)`` decorates a function using a caller.
     """
     if func is not None:    # returns a decorated function
-        evaldict = func.func_globals.copy()
+        res = FunctionMaker.wrap(func, caller, undecorated=func,
+                                 __wrapped__=func)
+        if res is not None:
+            return res
+        evaldict = _get_globals(func).copy()
         evaldict['_call_'] = caller
         evaldict['_func_'] = func
         return FunctionMaker.create(
@@ -230,7 +417,7 @@ def flat_decorator(caller, func=None):
         except IndexError:
             deco_sign = '%s()' % caller.__name__
             deco_body = 'return _call_'
-        evaldict = caller.func_globals.copy()
+        evaldict = _get_globals(caller).copy()
         evaldict['_call_'] = caller
         evaldict['flat_decorator'] = evaldict['decorator'] = flat_decorator
         return FunctionMaker.create(
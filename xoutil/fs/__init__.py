@@ -34,6 +34,15 @@ from xoutil.fs.path import normalize_path
 from six import string_types
 
 
+try:
+    from os import scandir as _scandir
+except ImportError:
+    try:
+        from scandir import scandir as _scandir
+    except ImportError:
+        _scandir = None
+
+
 re_magic = _rcompile('[*?[]')
 has_magic = lambda s: re_magic.search(s) is not None
 
@@ -57,8 +66,118 @@ def _get_regex(pattern=None, regex_pattern=None, shell_pattern=None):
                         '(%s given)' % arg_count)
 
 
+class _DirEntry(object):
+    '''Minimal replacement of `os.DirEntry` when `scandir` is missing.'''
+    __slots__ = (str('name'), str('path'))
+
+    def __init__(self, dirpath, name):
+        self.name = name
+        self.path = os.path.join(dirpath, name)
+
+    def is_dir(self):
+        return os.path.isdir(self.path)
+
+    def is_symlink(self):
+        return os.path.islink(self.path)
+
+    def stat(self, follow_symlinks=True):
+        return os.stat(self.path) if follow_symlinks else os.lstat(self.path)
+
+
+def _list_entries(dirpath):
+    '''Return the entries of `dirpath` in the order the system lists them,
+    or an empty list if it can't be read.'''
+    try:
+        if _scandir is not None:
+            return list(_scandir(dirpath))
+        else:
+            return [_DirEntry(dirpath, name) for name in os.listdir(dirpath)]
+    except os.error:
+        return []
+
+
+def _scan_dir(dirpath, followlinks=False):
+    '''Return the entries of `dirpath` as a pair ``(dirs, files)``.
+
+    `dirs` are the entries of sub-directories that should be walked into, and
+    `files` the entries of everything else but symbolic links to directories
+    not to be followed (`os.walk` doesn't yield them as files either).
+    Errors are ignored (like `os.walk` does), so an unreadable directory has
+    no entries.
+
+    '''
+    dirs, files = [], []
+    for entry in _list_entries(dirpath):
+        try:
+            isdir = entry.is_dir()
+        except os.error:
+            isdir = False
+        if not isdir:
+            files.append(entry)
+        elif followlinks or not entry.is_symlink():
+            dirs.append(entry)
+    return dirs, files
+
+
+def _walk(top, followlinks=False, maxdepth=None, threads=None):
+    '''Walk the tree at `top` yielding ``(dirpath, dirs, files)``.
+
+    Like `os.walk` but `dirs` and `files` are lists of `os.DirEntry` objects,
+    so the file type (and in some platforms the stat result) that the
+    directory listing already provides is reused.  Symbolic links to
+    directories are walked into only if `followlinks` is True.
+
+    `top` has depth 1, and directories at `maxdepth` are not walked into.
+
+    If `threads` is given, directories are listed concurrently by that many
+    threads and the order of the results is undefined; otherwise the order
+    is the same as a top-down `os.walk`.
+
+    '''
+    if maxdepth is not None and maxdepth < 1:
+        return
+    if threads:
+        from multiprocessing.pool import ThreadPool
+        from six.moves.queue import Queue
+        pool = ThreadPool(threads)
+        done = Queue()
+
+        def scan(dirpath, depth):
+            try:
+                dirs, files = _scan_dir(dirpath, followlinks)
+            except BaseException as error:
+                # Let the consumer raise it, or it would wait forever.
+                dirs, files = error, None
+            done.put((dirpath, depth, dirs, files))
+
+        try:
+            pool.apply_async(scan, (top, 1))
+            pending = 1
+            while pending:
+                dirpath, depth, dirs, files = done.get()
+                pending -= 1
+                if files is None:
+                    raise dirs
+                if maxdepth is None or depth < maxdepth:
+                    for entry in dirs:
+                        pool.apply_async(scan, (entry.path, depth + 1))
+                        pending += 1
+                yield dirpath, dirs, files
+        finally:
+            pool.terminate()
+    else:
+        stack = [(top, 1)]
+        while stack:
+            dirpath, depth = stack.pop()
+            dirs, files = _scan_dir(dirpath, followlinks)
+            yield dirpath, dirs, files
+            if maxdepth is None or depth < maxdepth:
+                stack.extend((entry.path, depth + 1)
+                             for entry in reversed(dirs))
+
+
 def iter_files(top='.', pattern=None, regex_pattern=None, shell_pattern=None,
-               followlinks=False, maxdepth=None):
+               followlinks=False, maxdepth=None, threads=None):
     '''Iterate filenames recursively.
 
     :param top: The top directory for recurse into.
@@ -82,22 +201,28 @@ def iter_files(top='.', pattern=None, regex_pattern=None, shell_pattern=None,
 
                      .. versionadded:: 1.2.1
 
+    :param threads: If given, list directories concurrently with that many
+                    threads.  Files are still yielded as soon as they are
+                    found, but in no particular order.
+
+                    .. versionadded:: 1.7.0
+
     .. warning:: It's an error to pass more than pattern argument.
 
+    .. versionchanged:: 1.7.0 Directories are listed with `os.scandir` and
+       `maxdepth` counts the levels of the tree (`top` is level 1) instead of
+       the directories visited.
+
     '''
     regex = _get_regex(pattern, regex_pattern, shell_pattern)
-    depth = 0
-    for dirpath, _dirs, filenames in os.walk(normalize_path(top),
-                                             topdown=True,
-                                             followlinks=followlinks):
-        for filename in filenames:
-            path = os.path.join(dirpath, filename)
-            if (regex is None) or regex.search(path):
+    search = regex.search if regex is not None else None
+    for _dirpath, _dirs, files in _walk(normalize_path(top),
+                                        followlinks=followlinks,
+                                        maxdepth=maxdepth, threads=threads):
+        for entry in files:
+            path = entry.path
+            if (search is None) or search(path):
                 yield path
-        if maxdepth is not None:
-            depth += 1
-            if depth >= maxdepth:
-                _dirs[:] = []
 
 
 # ------------------------------ iter_dict_files ------------------------------
@@ -111,7 +236,8 @@ _REGEX_DEFAULT_ALLFILES = _rcompile(r'^(?P<dir>.+(?=/)/)?'
                                     r'([.](?P<ext>[^.]+))?$')
 
 
-def iter_dict_files(top='.', regex=None, wrong=None, followlinks=False):
+def iter_dict_files(top='.', regex=None, wrong=None, followlinks=False,
+                    threads=None):
     '''
     Iterate filenames recursively.
 
@@ -122,6 +248,10 @@ def iter_dict_files(top='.', regex=None, wrong=None, followlinks=False):
 
                         .. versionadded:: 1.2.1
 
+    :param threads: The same meaning that in `iter_files`:func:.
+
+                    .. versionadded:: 1.7.0
+
     .. versionadded:: 1.2.0
 
     '''
@@ -130,10 +260,11 @@ def iter_dict_files(top='.', regex=None, wrong=None, followlinks=False):
             regex = _rcompile(regex)
     else:
         regex = _REGEX_DEFAULT_ALLFILES
-    for dirpath, _dirs, filenames in os.walk(normalize_path(top),
-                                             followlinks=followlinks):
-        for filename in filenames:
-            path = os.path.join(dirpath, filename)
+    for _dirpath, _dirs, files in _walk(normalize_path(top),
+                                        followlinks=followlinks,
+                                        threads=threads):
+        for entry in files:
+            path = entry.path
             match = regex.match(path)
             if match:
                 yield match.groupdict()
@@ -141,15 +272,19 @@ def iter_dict_files(top='.', regex=None, wrong=None, followlinks=False):
                 yield {wrong: path}
 
 
-def iter_dirs(top='.', pattern=None, regex_pattern=None, shell_pattern=None):
+def iter_dirs(top='.', pattern=None, regex_pattern=None, shell_pattern=None,
+              threads=None):
     '''
     Iterate directories recursively.
 
     The params have analagous meaning that in :func:`iter_files` and the same
     restrictions.
+
+    .. versionchanged:: 1.7.0 Added the `threads` argument.
+
     '''
     regex = _get_regex(pattern, regex_pattern, shell_pattern)
-    for path, _dirs, _files in os.walk(normalize_path(top)):
+    for path, _dirs, _files in _walk(normalize_path(top), threads=threads):
         if (regex is None) or regex.search(path):
             yield path
 
@@ -362,10 +497,14 @@ def listdir(path):
 
 def _list_magic(dirname, pattern):
     re = _get_regex(pattern)
-    for name in listdir(dirname or os.curdir):
+    for entry in _list_entries(normalize_path(dirname or os.curdir)):
+        name = entry.name
         if re.match(name):
             full = os.path.join(dirname, name)
-            yield full, lstat(full)
+            try:
+                yield full, entry.stat(follow_symlinks=False)
+            except os.error:
+                yield full, None
 
 
 def _list_one(fname):
@@ -518,7 +657,140 @@ def ensure_filename(filename, yields=False):
                           filename)
 
 
-def concatfiles(*files):
+# Size of the buffer used by `concatfiles` when the kernel can't copy.
+_COPY_BUFSIZE = 1024 * 1024
+
+
+def _regular_fd(fh):
+    '''Return the file descriptor of `fh` if it's a regular file, or
+    None.'''
+    from io import TextIOBase
+    from stat import S_ISREG
+    if isinstance(fh, TextIOBase):
+        return None
+    try:
+        fd = fh.fileno()
+        return fd if S_ISREG(os.fstat(fd).st_mode) else None
+    except (AttributeError, ValueError, os.error):
+        # io.UnsupportedOperation is both an OSError and a ValueError.
+        return None
+
+
+def _kernel_copy(src, dst, offset, count, dst_offset=None):
+    '''Copy `count` bytes from the fd `src` at `offset` to the fd `dst`.
+
+    If `dst_offset` is None, write at the current position of `dst`.  Use
+    `os.copy_file_range` or `os.sendfile` (if `dst_offset` is None).
+
+    :returns: The number of bytes copied; less than `count` if the kernel
+              refused to copy (the rest should be copied otherwise).
+
+    '''
+    import errno
+    copy_range = getattr(os, 'copy_file_range', None)
+    sendfile = getattr(os, 'sendfile', None) if dst_offset is None else None
+    refused = {getattr(errno, name, None)
+               for name in ('EXDEV', 'ENOSYS', 'EINVAL', 'EBADF', 'ENOTSUP',
+                            'EOPNOTSUPP')}
+    done = 0
+    while done < count and (copy_range or sendfile):
+        chunk = min(count - done, 1 << 30)
+        try:
+            if copy_range:
+                if dst_offset is None:
+                    n = copy_range(src, dst, chunk, offset + done)
+                else:
+                    n = copy_range(src, dst, chunk, offset + done,
+                                   dst_offset + done)
+            else:
+                n = sendfile(dst, src, offset + done, chunk)
+        except OSError as error:
+            if error.errno not in refused:
+                raise
+            if copy_range:
+                copy_range = None
+            else:
+                sendfile = None
+            continue
+        if not n:
+            break
+        done += n
+    return done
+
+
+def _buffered_copy(fh, target, buf):
+    '''Copy the rest of `fh` into `target` reusing the bytearray `buf`.'''
+    readinto = getattr(fh, 'readinto', None)
+    if readinto is None:
+        import shutil
+        shutil.copyfileobj(fh, target, len(buf))
+    else:
+        import io
+        # Only `io` binary streams are known to take a memoryview; others
+        # (e.g. Python 2 files) get a copy of the bytes.
+        binary = isinstance(target, (io.RawIOBase, io.BufferedIOBase))
+        data = memoryview(buf) if binary else buf
+        n = readinto(buf)
+        while n:
+            target.write(data[:n])
+            n = readinto(buf)
+
+
+def _copy_into(fh, target, buf):
+    '''Append the rest of `fh` to `target`, in the kernel if possible.'''
+    src, dst = _regular_fd(fh), _regular_fd(target)
+    if src is not None and dst is not None:
+        target.flush()
+        offset = fh.tell()
+        count = max(os.fstat(src).st_size - offset, 0)
+        copied = _kernel_copy(src, dst, offset, count)
+        fh.seek(offset + copied)
+        # Writes went through the descriptor; resync the file object.
+        target.seek(os.lseek(dst, 0, os.SEEK_CUR))
+    _buffered_copy(fh, target, buf)
+
+
+def _parallel_concat(sources, target, threads, buf):
+    '''Copy the files named in `sources` to the file named `target` by
+    pieces at computed offsets in several threads.
+
+    Return False (doing nothing) if the platform can't write at offsets.
+
+    '''
+    pwrite, pread = getattr(os, 'pwrite', None), getattr(os, 'pread', None)
+    if pwrite is None or pread is None:
+        return False
+    from multiprocessing.pool import ThreadPool
+    sizes = [os.stat(source).st_size for source in sources]
+    offsets = [sum(sizes[:i]) for i in range(len(sizes))]
+    bufsize = len(buf)
+    with open(target, 'wb') as fh:
+        fh.truncate(sum(sizes))
+    dst = os.open(target, os.O_WRONLY)
+
+    def copy(args):
+        source, offset, size = args
+        src = os.open(source, os.O_RDONLY)
+        try:
+            done = _kernel_copy(src, dst, 0, size, dst_offset=offset)
+            while done < size:
+                data = pread(src, min(bufsize, size - done), done)
+                if not data:
+                    raise IOError('File "%s" shrunk while copying' % source)
+                done += pwrite(dst, data, offset + done)
+        finally:
+            os.close(src)
+
+    pool = ThreadPool(threads)
+    try:
+        pool.map(copy, list(zip(sources, offsets, sizes)))
+    finally:
+        pool.terminate()
+        os.close(dst)
+    return True
+
+
+def concatfiles(*files, **kwargs):
     '''Concat several files to a single one.
 
     Each positional argument must be either:
@@ -534,10 +806,26 @@ def concatfiles(*files):
     Alternatively if there are only two positional arguments and the first is
     a collection, the sources will be the members of the first argument.
 
+    When both a source and the target are regular files, the data is copied
+    by the kernel (with `os.copy_file_range` or `os.sendfile`) without
+    passing through Python.  Otherwise a single large buffer is reused for
+    every source.
+
+    :param threads: *optional* Keyword-only.  If all the files are given by
+                    path, the target is created with its final size and the
+                    sources are copied at their offsets by that many threads.
+                    Needs `os.pwrite` (Python 3.3+), otherwise ignored.
+
+    .. versionchanged:: 1.7.0 Copy in the kernel when possible; add the
+       `threads` argument.
+
     '''
-    import shutil
     from xoutil.types import is_collection
     from six import string_types
+    threads = kwargs.pop('threads', None)
+    if kwargs:
+        raise TypeError('Invalid keyword arguments for concatfiles: %s'
+                        % ', '.join(kwargs))
     if len(files) < 2:
         raise TypeError('At least 2 files must be passed to concatfiles.')
     elif len(files) == 2:
@@ -546,6 +834,11 @@ def concatfiles(*files):
             files = [files]
     else:
         files, target = files[:-1], files[-1]
+    buf = bytearray(_COPY_BUFSIZE)
+    paths_only = all(isinstance(f, string_types) for f in files)
+    if threads and paths_only and isinstance(target, string_types):
+        if _parallel_concat(files, target, threads, buf):
+            return
     if isinstance(target, string_types):
         target, opened = open(target, 'wb'), True
     else:
@@ -559,7 +852,7 @@ def concatfiles(*files):
                 fh = f
                 closefh = False
             try:
-                shutil.copyfileobj(fh, target)
+                _copy_into(fh, target, buf)
             finally:
                 if closefh:
                     fh.close()
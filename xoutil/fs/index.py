@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+# ---------------------------------------------------------------------
+# xoutil.fs.index
+# ---------------------------------------------------------------------
+# Copyright (c) 2015 Merchise Autrement and Contributors
+# All rights reserved.
+#
+# This is free software; you can redistribute it and/or modify it under the
+# terms of the LICENCE attached (see LICENCE file) in the distribution
+# package.
+#
+# Created on 2015-04-20
+
+'''A persistent index of the files in a directory tree.
+
+Scanning big trees repeatedly (as `xoutil.fs.iter_files`:func: does) is slow.
+A `FileIndex`:class: keeps the paths, sizes and modification times of a tree
+in a `sqlite3`:mod: database and refreshes it incrementally::
+
+    >>> from xoutil.fs.index import FileIndex
+    >>> index = FileIndex('/var/log', '/tmp/var-log.idx')  # doctest: +SKIP
+    >>> index.refresh()                                      # doctest: +SKIP
+    >>> list(index.iter_files('*.gz'))                       # doctest: +SKIP
+
+'''
+
+from __future__ import (division as _py3_division,
+                        print_function as _py3_print,
+                        unicode_literals as _py3_unicode,
+                        absolute_import as _py3_abs_import)
+
+import os
+
+from xoutil.fs import _get_regex, _scan_dir, stat
+from xoutil.fs.path import normalize_path
+
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, parent TEXT, '
+    'depth INTEGER, mtime REAL)',
+    'CREATE INDEX IF NOT EXISTS dirs_parent ON dirs (parent)',
+    'CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, dir TEXT, '
+    'depth INTEGER, size INTEGER, mtime REAL)',
+    'CREATE INDEX IF NOT EXISTS files_dir ON files (dir)',
+)
+
+
+class FileIndex(object):
+    '''An index of the files under `root` stored in the file `filename`.
+
+    :param root: The top directory of the indexed tree.
+
+    :param filename: The sqlite database holding the index; it's created if
+                     needed.  Use ``':memory:'`` for an index that lives only
+                     in this process.
+
+    :param followlinks: The same meaning that in `os.walk`.
+
+    The index is empty until `refresh`:meth: is called.
+
+    .. warning:: Refreshing only lists again the directories whose
+       modification time changed.  Creating, deleting or renaming a file
+       changes it, but writing to an existing file does not: its size and
+       modification time in the index are updated on the next
+       ``refresh(full=True)``.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    def __init__(self, root, filename, followlinks=False):
+        import sqlite3
+        self.root = normalize_path(root)
+        self.followlinks = followlinks
+        self.connection = sqlite3.connect(filename)
+        with self.connection as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def close(self):
+        '''Close the database.'''
+        self.connection.close()
+
+    def refresh(self, full=False):
+        '''Bring the index up to date with the file system.
+
+        Directories are listed again only if they are new, or their
+        modification time changed, or `full` is True.  Directories that no
+        longer exist are removed from the index with all their files.
+
+        :returns: The number of directories listed.
+
+        '''
+        from collections import defaultdict
+        from stat import S_ISDIR
+        conn = self.connection
+        known, children = {}, defaultdict(list)
+        for path, parent, mtime in conn.execute(
+                'SELECT path, parent, mtime FROM dirs'):
+            known[path] = mtime
+            children[parent].append(path)
+        seen = set()
+        listed = 0
+        stack = [(self.root, None, 1)]
+        with conn:
+            while stack:
+                path, parent, depth = stack.pop()
+                st = stat(path)
+                if st is None or not S_ISDIR(st.st_mode) or path in seen:
+                    continue
+                seen.add(path)
+                if not full and known.get(path) == st.st_mtime:
+                    stack.extend((child, path, depth + 1)
+                                 for child in children[path])
+                    continue
+                listed += 1
+                dirs, files = _scan_dir(path, self.followlinks)
+                conn.execute('DELETE FROM files WHERE dir = ?', (path, ))
+                conn.executemany(
+                    'INSERT INTO files VALUES (?, ?, ?, ?, ?)',
+                    ((entry.path, path, depth) + _size_and_mtime(entry)
+                     for entry in files))
+                conn.execute('INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?)',
+                             (path, parent, depth, st.st_mtime))
+                stack.extend((entry.path, path, depth + 1) for entry in dirs)
+            gone = [(path, ) for path in known if path not in seen]
+            conn.executemany('DELETE FROM files WHERE dir = ?', gone)
+            conn.executemany('DELETE FROM dirs WHERE path = ?', gone)
+        return listed
+
+    def iter_stats(self, pattern=None, regex_pattern=None, shell_pattern=None,
+                   maxdepth=None):
+        '''Like `iter_files`:meth: but yields triples ``(path, size,
+        mtime)``.'''
+        regex = _get_regex(pattern, regex_pattern, shell_pattern)
+        search = regex.search if regex is not None else None
+        query = 'SELECT path, size, mtime FROM files'
+        if maxdepth is not None:
+            rows = self.connection.execute(query + ' WHERE depth <= ?',
+                                           (maxdepth, ))
+        else:
+            rows = self.connection.execute(query)
+        for row in rows:
+            if search is None or search(row[0]):
+                yield row
+
+    def iter_files(self, pattern=None, regex_pattern=None, shell_pattern=None,
+                   maxdepth=None):
+        '''Iterate the indexed filenames.
+
+        The arguments have the same meaning that in
+        `xoutil.fs.iter_files`:func:.
+
+        '''
+        for path, _size, _mtime in self.iter_stats(pattern, regex_pattern,
+                                                   shell_pattern, maxdepth):
+            yield path
+
+    def iter_dirs(self, pattern=None, regex_pattern=None, shell_pattern=None):
+        '''Iterate the indexed directories.
+
+        The arguments have the same meaning that in
+        `xoutil.fs.iter_dirs`:func:.
+
+        '''
+        regex = _get_regex(pattern, regex_pattern, shell_pattern)
+        for path, in self.connection.execute('SELECT path FROM dirs'):
+            if regex is None or regex.search(path):
+                yield path
+
+
+def _size_and_mtime(entry):
+    '''Return ``(size, mtime)`` of a directory entry (of the link itself if
+    it's a broken link).'''
+    try:
+        st = entry.stat()
+    except os.error:
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except os.error:
+            return None, None
+    return st.st_size, st.st_mtime
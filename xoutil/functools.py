@@ -33,6 +33,7 @@ py33 = sys.version_info >= (3, 3, 0)
 del sys
 
 from six import callable
+from six import integer_types as _integer_types, text_type as _text_type
 
 
 class ctuple(tuple):
@@ -135,7 +136,9 @@ def power(*args):
 
 if not py33:
     from threading import RLock
-    from xoutil.collections import namedtuple
+    # Not from `xoutil.collections`: it imports `xoutil.objects` which uses
+    # `lru_cache`.
+    from collections import namedtuple
 
     _CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize",
                                           "currsize"])
@@ -284,7 +287,7 @@ if not py33:
 
         # Constants shared by all lru cache instances:
         sentinel = object()        # unique object used to signal cache misses
-        make_key = _make_key       # build a key from the function arguments
+        make_key = _fast_key       # build a key from the function arguments
         PREV, NEXT, KEY, RESULT = 0, 1, 2, 3   # names for the link fields
 
         def decorating_function(user_function):
@@ -413,3 +416,754 @@ if not py33:
             return update_wrapper(wrapper, user_function)
 
         return decorating_function
+
+
+def _fast_key(args, kwds, typed,
+              kwd_mark=(object(), ),
+              fasttypes=frozenset((int, str, bytes, frozenset, type(None)) +
+                                  _integer_types + (_text_type, )),
+              sorted=sorted, type=type, len=len):
+    '''Make a cache key from positional and keyword arguments.
+
+    Equivalent to `_make_key` but the key depends on the shape of the call:
+
+    - A single argument of a type known to cache its hash is returned as is.
+
+    - Only positional arguments: the `args` tuple itself.  Hashing small
+      tuples of scalars is cheaper than building a `_HashedSeq`.
+
+    - Keyword arguments: a tuple with `args`, a marker and the items
+      (sorted if several).
+
+    - Typed keys are made by `_make_key`.
+
+    '''
+    if typed:
+        return _make_key(args, kwds, typed)
+    elif not kwds:
+        if len(args) == 1 and type(args[0]) in fasttypes:
+            return args[0]
+        else:
+            return args
+    elif len(kwds) == 1:
+        return args + kwd_mark + tuple(kwds.items())[0]
+    else:
+        key = args + kwd_mark
+        for item in sorted(kwds.items()):
+            key += item
+        return key
+
+
+from collections import namedtuple as _namedtuple
+
+_CacheStats = _namedtuple('CacheStats', ['hits', 'misses', 'coalesced',
+                                         'maxsize', 'currsize'])
+del _namedtuple
+
+
+class _Store(object):
+    '''The storage of the results cached by `memoize`:func:.
+
+    Keys map to entries whose two first items are the result and the time it
+    expires at (None for never).  Sub-classes implement the eviction policy
+    in `_touch`, `_insert`, `_discard` and `_evict`.  All methods must be
+    called with `lock` acquired.
+
+    '''
+    def __init__(self, maxsize, ttl, timer):
+        from threading import RLock
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.lock = RLock()
+        self.hits = self.misses = self.coalesced = 0
+        self.data = {}
+
+    def __len__(self):
+        return len(self.data)
+
+    def lookup(self, key, default=None, count=True):
+        '''Return the live result for `key` or `default`.
+
+        If `count` is False, the hits and misses are not updated.
+
+        '''
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is not None:
+                expires = entry[1]
+                if expires is None or expires > self.timer():
+                    self._touch(key)
+                    if count:
+                        self.hits += 1
+                    return entry[0]
+                else:
+                    self._discard(key)
+            if count:
+                self.misses += 1
+            return default
+
+    def save(self, key, result):
+        '''Cache `result` for `key`, evicting an entry if full.'''
+        maxsize = self.maxsize
+        if maxsize != 0:
+            ttl = self.ttl
+            if ttl is None:
+                expires = None
+            else:
+                if callable(ttl):
+                    ttl = ttl(result)
+                expires = None if ttl is None else self.timer() + ttl
+            with self.lock:
+                if key in self.data:
+                    self._discard(key)
+                elif maxsize is not None and len(self.data) >= maxsize:
+                    self._evict()
+                self._insert(key, result, expires)
+
+    def info(self):
+        '''Report cache statistics.'''
+        with self.lock:
+            return _CacheInfo(self.hits, self.misses, self.maxsize,
+                              len(self.data))
+
+    def stats(self):
+        '''Report cache statistics, including the coalesced misses.'''
+        with self.lock:
+            return _CacheStats(self.hits, self.misses, self.coalesced,
+                               self.maxsize, len(self.data))
+
+    def clear(self):
+        '''Clear the cache and cache statistics.'''
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = self.coalesced = 0
+
+
+class _LRUStore(_Store):
+    '''Evict the least recently used entry.'''
+    def __init__(self, maxsize, ttl, timer):
+        from collections import OrderedDict
+        super(_LRUStore, self).__init__(maxsize, ttl, timer)
+        self.data = OrderedDict()
+        move_to_end = getattr(self.data, 'move_to_end', None)
+        if move_to_end is not None:
+            self._touch = move_to_end
+
+    def _touch(self, key):
+        data = self.data
+        data[key] = data.pop(key)
+
+    def _insert(self, key, result, expires):
+        self.data[key] = (result, expires)
+
+    def _discard(self, key):
+        del self.data[key]
+
+    def _evict(self):
+        self.data.popitem(last=False)
+
+
+class _LFUStore(_Store):
+    '''Evict the least frequently used entry (the least recently used among
+    the ones with the same frequency).'''
+    def __init__(self, maxsize, ttl, timer):
+        super(_LFUStore, self).__init__(maxsize, ttl, timer)
+        self.buckets = {}    # {frequency: OrderedDict of keys}
+        self.minfreq = 0
+
+    def _touch(self, key):
+        entry = self.data[key]
+        freq = entry[2]
+        self._unlink(key, freq)
+        if self.minfreq == freq and freq not in self.buckets:
+            self.minfreq = freq + 1
+        entry[2] = freq + 1
+        self._link(key, freq + 1)
+
+    def _insert(self, key, result, expires):
+        self.data[key] = [result, expires, 1]
+        self._link(key, 1)
+        self.minfreq = 1
+
+    def _discard(self, key):
+        self._unlink(key, self.data.pop(key)[2])
+
+    def _evict(self):
+        buckets = self.buckets
+        if self.minfreq not in buckets:
+            self.minfreq = min(buckets)
+        key, _ = buckets[self.minfreq].popitem(last=False)
+        if not buckets[self.minfreq]:
+            del buckets[self.minfreq]
+        del self.data[key]
+
+    def _link(self, key, freq):
+        from collections import OrderedDict
+        bucket = self.buckets.get(freq)
+        if bucket is None:
+            bucket = self.buckets[freq] = OrderedDict()
+        bucket[key] = None
+
+    def _unlink(self, key, freq):
+        bucket = self.buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[freq]
+
+    def clear(self):
+        with self.lock:
+            super(_LFUStore, self).clear()
+            self.buckets.clear()
+            self.minfreq = 0
+
+
+_STORES = {'lru': _LRUStore, 'lfu': _LFUStore}
+
+
+def _store_factory(maxsize, ttl, policy, timer):
+    '''Return a function creating the storages for `memoize`:func: and
+    `memoize_method`:func:.'''
+    store = _STORES.get(policy)
+    if store is None:
+        msg = "Invalid policy '%s', expected one of: %s"
+        raise ValueError(msg % (policy, ', '.join(sorted(_STORES))))
+    if timer is None:
+        try:
+            from time import monotonic as timer
+        except ImportError:
+            from time import time as timer
+    return partial(store, maxsize, ttl, timer)
+
+
+def memoize(maxsize=128, ttl=None, policy='lru', typed=False, timer=None,
+            coalesce=False):
+    '''Decorator to wrap a function with a memoizing callable.
+
+    It's like `lru_cache`:func: (and has the same `cache_info()`,
+    `cache_clear()` and ``__wrapped__``) but the cache is thread-safe and
+    results may expire:
+
+    :param maxsize: The maximum number of results kept.  If None the cache
+                    grows without bound.
+
+    :param ttl: Seconds a result is valid since it was computed, or None
+                (the default) for no expiration.  It may be a callable that
+                receives the result and returns its `ttl`.
+
+    :param policy: What to evict when the cache is full: ``'lru'`` (least
+                   recently used) or ``'lfu'`` (least frequently used).
+
+    :param typed: The same meaning that in `lru_cache`:func:.
+
+    :param timer: A function returning the current time in seconds.  The
+                  default is `time.monotonic` (`time.time` in Python 2).
+
+    :param coalesce: If True, calls with the same arguments that miss the
+                     cache while the result is being computed by another
+                     thread wait for it instead of computing it again.
+
+    Expired results are removed when they are looked up or evicted.
+
+    The wrapper also has a `cache_stats()` that returns a named tuple with
+    `hits`, `misses`, `coalesced` (the misses that waited for another call),
+    `maxsize` and `currsize`.
+
+    Example::
+
+        >>> @memoize(maxsize=1000, ttl=60)
+        ... def rate(currency):
+        ...     return 1 if currency == 'USD' else 2
+
+        >>> rate('EUR'), rate('EUR')
+        (2, 2)
+        >>> rate.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=1000, currsize=1)
+
+    .. versionadded:: 1.7.0
+
+    '''
+    new_store = _store_factory(maxsize, ttl, policy, timer)
+
+    def decorator(user_function):
+        wrapper = _memoizer(user_function, new_store(), typed, coalesce)
+        return update_wrapper(wrapper, user_function)
+    return decorator
+
+
+def _memoizer(user_function, store, typed, coalesce=False,
+              make_key=None):
+    '''Return a wrapper of `user_function` caching its results in `store`.'''
+    if make_key is None:
+        make_key = _fast_key
+    sentinel = object()
+    lookup, save = store.lookup, store.save
+
+    if not coalesce:
+
+        def wrapper(*args, **kwds):
+            key = make_key(args, kwds, typed)
+            result = lookup(key, sentinel)
+            if result is sentinel:
+                result = user_function(*args, **kwds)
+                save(key, result)
+            return result
+
+    else:
+        from threading import Lock
+        computing = {}    # {key: lock held while computing}
+
+        def wrapper(*args, **kwds):
+            key = make_key(args, kwds, typed)
+            result = lookup(key, sentinel)
+            if result is sentinel:
+                with store.lock:
+                    lock = computing.get(key)
+                    waiting = lock is not None
+                    if not waiting:
+                        # It may have been computed since the look-up.
+                        result = lookup(key, sentinel, count=False)
+                        if result is sentinel:
+                            lock = computing[key] = Lock()
+                            lock.acquire()
+                        else:
+                            store.coalesced += 1
+                if waiting:
+                    with lock:
+                        pass
+                    with store.lock:
+                        store.coalesced += 1
+                    # The result is not there if the computation failed
+                    # (or expired already).
+                    result = lookup(key, sentinel, count=False)
+                if result is sentinel:
+                    try:
+                        result = user_function(*args, **kwds)
+                        save(key, result)
+                    finally:
+                        if not waiting:
+                            with store.lock:
+                                del computing[key]
+                            lock.release()
+            return result
+
+    wrapper.cache_info = store.info
+    wrapper.cache_stats = store.stats
+    wrapper.cache_clear = store.clear
+    return wrapper
+
+
+def async_memoize(maxsize=128, ttl=None, policy='lru', typed=False,
+                  timer=None):
+    '''Decorator to memoize the results of a coroutine function.
+
+    The arguments are the same of `memoize`:func:.  The result of the
+    coroutine (not the coroutine object) is cached, and calls with the same
+    arguments while the result is being computed await the same computation
+    (they are counted as `coalesced` in `cache_stats()`).  Exceptions and
+    cancellations are not cached.
+
+    The wrapper is not a coroutine function, it returns an `asyncio`:mod:
+    future that must be awaited within a running event loop.  Cancelling a
+    caller doesn't cancel the shared computation.
+
+    Requires Python 3.5 or later.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    new_store = _store_factory(maxsize, ttl, policy, timer)
+
+    def decorator(user_function):
+        wrapper = _async_memoizer(user_function, new_store(), typed)
+        return update_wrapper(wrapper, user_function)
+    return decorator
+
+
+def _async_memoizer(user_function, store, typed, make_key=None):
+    '''Like `_memoizer` for coroutine functions.'''
+    import asyncio
+    if make_key is None:
+        make_key = _fast_key
+    sentinel = object()
+    lookup, save = store.lookup, store.save
+    computing = {}    # {key: (loop, task)}
+
+    def wrapper(*args, **kwds):
+        key = make_key(args, kwds, typed)
+        result = lookup(key, sentinel)
+        loop = asyncio.get_event_loop()
+        if result is not sentinel:
+            res = loop.create_future()
+            res.set_result(result)
+            return res
+        with store.lock:
+            running = computing.get(key)
+            if running is not None and running[0] is loop:
+                store.coalesced += 1
+                return asyncio.shield(running[1])
+            task = asyncio.ensure_future(user_function(*args, **kwds))
+            computing[key] = (loop, task)
+
+        def done(task):
+            with store.lock:
+                if computing.get(key, (None, None))[1] is task:
+                    del computing[key]
+            if not task.cancelled() and task.exception() is None:
+                save(key, task.result())
+
+        task.add_done_callback(done)
+        return asyncio.shield(task)
+
+    wrapper.cache_info = store.info
+    wrapper.cache_stats = store.stats
+    wrapper.cache_clear = store.clear
+    return wrapper
+
+
+def memoize_method(maxsize=128, ttl=None, policy='lru', typed=False,
+                   timer=None):
+    '''Decorator to memoize a method for each instance.
+
+    The arguments are the same of `memoize`:func: and apply to each instance
+    separately; the method arguments (but `self`) are part of the key.  The
+    caches are kept in a map weakly referencing the instances, so they are
+    released with them and the instances don't need a ``__dict__`` (but they
+    must support weak references).
+
+    The method got from an instance has the `cache_info()` and
+    `cache_clear()` of the instance cache::
+
+        >>> class Account(object):
+        ...     @memoize_method(ttl=5)
+        ...     def balance(self, currency='USD'):
+        ...         return 0
+
+        >>> account = Account()
+        >>> account.balance(), account.balance()
+        (0, 0)
+        >>> account.balance.cache_info()
+        CacheInfo(hits=1, misses=1, maxsize=128, currsize=1)
+
+    .. versionadded:: 1.7.0
+
+    '''
+    new_store = _store_factory(maxsize, ttl, policy, timer)
+
+    def decorator(method):
+        return _MethodMemoizer(method, new_store, typed)
+    return decorator
+
+
+class _MethodMemoizer(object):
+    '''The descriptor returned by `memoize_method`:func:.'''
+    def __init__(self, method, new_store, typed):
+        from threading import Lock
+        self.method = method
+        self.new_store = new_store
+        self.typed = typed
+        self.lock = Lock()
+        # {id(instance): (weakref to instance, wrapper)}
+        self.instances = {}
+        update_wrapper(self, method)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        entry = self.instances.get(id(instance))
+        if entry is None or entry[0]() is not instance:
+            entry = self._register(instance)
+        return entry[1]
+
+    def _register(self, instance):
+        from weakref import ref
+        key = id(instance)
+        instances = self.instances
+
+        def release(_ref):
+            with self.lock:
+                if instances.get(key, (None, ))[0] is _ref:
+                    del instances[key]
+
+        try:
+            reference = ref(instance, release)
+        except TypeError:
+            msg = "memoize_method needs weak references to '%s' objects"
+            raise TypeError(msg % type(instance).__name__)
+        method = self.method
+
+        def bound(*args, **kwds):
+            return method(reference(), *args, **kwds)
+
+        memoizer = _memoizer(bound, self.new_store(), self.typed)
+        wrapper = update_wrapper(memoizer, method)
+        entry = (reference, wrapper)
+        with self.lock:
+            instances[key] = entry
+        return entry
+
+    def cache_clear(self):
+        '''Clear the caches of all instances.'''
+        with self.lock:
+            wrappers = [wrapper for _ref, wrapper in self.instances.values()]
+        for wrapper in wrappers:
+            wrapper.cache_clear()
+
+
+def disk_memoize(filename, maxsize=None, maxbytes=None, ttl=None,
+                 typed=False, memory=128, namespace=None):
+    '''Decorator to memoize a function in a `sqlite3`:mod: database.
+
+    Results are kept in the file `filename`, so they survive the process.
+    They are pickled, and the keys are a stable hash of the pickled
+    arguments (with sets and dicts in a fixed order): use simple values
+    (strings, numbers, tuples, ...) as arguments.
+
+    :param maxsize: The maximum number of results kept in the file.  None
+                    for no limit.
+
+    :param maxbytes: The maximum size of the pickled results kept in the
+                     file.  None for no limit.
+
+    :param ttl: Seconds a result is valid since it was computed, or None for
+                no expiration.  It may be a callable that receives the result
+                and returns its `ttl`.  It's measured with `time.time`
+                because it must hold across processes.
+
+    :param typed: The same meaning that in `lru_cache`:func:.
+
+    :param memory: The number of results also kept in memory in front of the
+                   file (in LRU order).  Use 0 to always read the file.
+
+    :param namespace: Identifies the function in the file, so several
+                      functions (or processes) may share it.  It defaults to
+                      the module and name of the function.
+
+    When the limits are exceeded, the least recently used results are
+    removed (reading a result from the memory tier doesn't count as a use,
+    and uses are written to the file in batches, so other processes see
+    them late).  The limits apply to each namespace.
+
+    The wrapper has `cache_info()`, `cache_stats()` and `cache_clear()`
+    like `memoize`:func:.  `cache_clear()` removes the results of the
+    namespace from the file.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    def decorator(user_function):
+        name = namespace
+        if name is None:
+            qualname = getattr(user_function, '__qualname__',
+                               user_function.__name__)
+            name = '%s.%s' % (user_function.__module__, qualname)
+        store = _DiskStore(filename, name, maxsize, maxbytes, ttl, memory)
+        make_key = partial(_stable_key, name)
+        wrapper = _memoizer(user_function, store, typed, make_key=make_key)
+        return update_wrapper(wrapper, user_function)
+    return decorator
+
+
+_PICKLE_PROTOCOL = 2
+
+
+def _stable_key(namespace, args, kwds, typed):
+    '''Make a key that is the same across processes.'''
+    from hashlib import sha1
+    items = sorted(kwds.items())
+    parts = (namespace, args, items)
+    if typed:
+        parts += (tuple(type(v).__name__ for v in args),
+                  tuple(type(v).__name__ for _k, v in items))
+    return sha1(_dumps(_canonical(parts))).hexdigest()
+
+
+def _dumps(value):
+    '''Pickle `value` without memo, so shared and equal objects are
+    pickled the same.'''
+    from io import BytesIO
+    from pickle import Pickler
+    buf = BytesIO()
+    pickler = Pickler(buf, _PICKLE_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(value)
+    return buf.getvalue()
+
+
+def _canonical(value):
+    '''Rebuild the sets and dicts within `value` in a fixed order (their
+    iteration order varies with hash randomization).'''
+    kind = type(value)
+    if kind in (tuple, list):
+        return kind(_canonical(item) for item in value)
+    elif kind in (set, frozenset):
+        items = sorted(_dumps(_canonical(item)) for item in value)
+        return (kind.__name__, tuple(items))
+    elif kind is dict:
+        items = sorted((_dumps(_canonical(k)), _canonical(v))
+                       for k, v in value.items())
+        return (kind.__name__, tuple(items))
+    else:
+        return value
+
+
+class _DiskStore(object):
+    '''The storage of `disk_memoize`:func:.
+
+    It has the same interface of `_Store`.
+
+    '''
+    _SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS memo (key TEXT PRIMARY KEY, '
+        'namespace TEXT, value BLOB, size INTEGER, expires REAL, used REAL)',
+        'CREATE INDEX IF NOT EXISTS memo_used ON memo (namespace, used)',
+    )
+
+    # The number of uses kept in memory before writing them.
+    _USED_BATCH = 64
+
+    def __init__(self, filename, namespace, maxsize, maxbytes, ttl, memory):
+        import sqlite3
+        from threading import RLock
+        from time import time
+        self.connection = sqlite3.connect(filename, timeout=60,
+                                          check_same_thread=False)
+        with self.connection as conn:
+            for statement in self._SCHEMA:
+                conn.execute(statement)
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        self.timer = time
+        # The memory tier keeps (result, expires) pairs.
+        self.memory = _LRUStore(memory, None, time) if memory else None
+        self.lock = RLock()
+        self.used = {}
+        self.hits = self.misses = self.coalesced = 0
+
+    def lookup(self, key, default=None, count=True):
+        from pickle import loads
+        now = self.timer()
+        with self.lock:
+            memory = self.memory
+            entry = memory.lookup(key, None, False) if memory else None
+            if entry is None:
+                conn = self.connection
+                row = conn.execute('SELECT value, expires FROM memo '
+                                   'WHERE key = ?', (key, )).fetchone()
+                if row is not None and (row[1] is None or row[1] > now):
+                    entry = loads(bytes(row[0])), row[1]
+                    if memory:
+                        memory.save(key, entry)
+                    self._touch(key, now)
+                elif row is not None:
+                    with conn:
+                        conn.execute('DELETE FROM memo WHERE key = ?',
+                                     (key, ))
+            if entry is not None and (entry[1] is None or entry[1] > now):
+                if count:
+                    self.hits += 1
+                return entry[0]
+            else:
+                if count:
+                    self.misses += 1
+                return default
+
+    def save(self, key, result):
+        from pickle import dumps
+        ttl = self.ttl
+        if callable(ttl):
+            ttl = ttl(result)
+        now = self.timer()
+        expires = None if ttl is None else now + ttl
+        value = dumps(result, _PICKLE_PROTOCOL)
+        with self.lock:
+            if self.memory:
+                self.memory.save(key, (result, expires))
+            with self.connection as conn:
+                conn.execute('INSERT OR REPLACE INTO memo VALUES '
+                             '(?, ?, ?, ?, ?, ?)',
+                             (key, self.namespace, _blob(value), len(value),
+                              expires, now))
+                self._flush_used(conn)
+                self._evict(conn)
+
+    def _touch(self, key, now):
+        '''Record that `key` was used.
+
+        Uses only matter to evict results, so they are tracked only if there
+        are limits.  They are written in batches (or before evicting) to
+        avoid a write transaction per hit.
+
+        '''
+        if self.maxsize is not None or self.maxbytes is not None:
+            used = self.used
+            used[key] = now
+            if len(used) >= self._USED_BATCH:
+                with self.connection as conn:
+                    self._flush_used(conn)
+
+    def _flush_used(self, conn):
+        '''Write the pending uses.'''
+        if self.used:
+            conn.executemany('UPDATE memo SET used = ? WHERE key = ?',
+                             [(now, key) for key, now in self.used.items()])
+            self.used.clear()
+
+    def _evict(self, conn):
+        '''Remove the least recently used results over the limits.'''
+        namespace = self.namespace
+        count, size = conn.execute('SELECT COUNT(*), SUM(size) FROM memo '
+                                   'WHERE namespace = ?',
+                                   (namespace, )).fetchone()
+        excess = 0
+        if self.maxsize is not None:
+            excess = max(count - self.maxsize, 0)
+        if self.maxbytes is not None and size > self.maxbytes:
+            rows = conn.execute('SELECT size FROM memo WHERE namespace = ? '
+                                'ORDER BY used', (namespace, ))
+            over, removed = size - self.maxbytes, 0
+            for row_size, in rows:
+                if removed >= over:
+                    break
+                removed += row_size
+                excess += 1
+        if excess:
+            conn.execute('DELETE FROM memo WHERE key IN (SELECT key FROM memo '
+                         'WHERE namespace = ? ORDER BY used LIMIT ?)',
+                         (namespace, excess))
+
+    def info(self):
+        '''Report cache statistics.'''
+        stats = self.stats()
+        return _CacheInfo(stats.hits, stats.misses, stats.maxsize,
+                          stats.currsize)
+
+    def stats(self):
+        '''Report cache statistics, including the coalesced misses.'''
+        with self.lock:
+            count, = self.connection.execute(
+                'SELECT COUNT(*) FROM memo WHERE namespace = ?',
+                (self.namespace, )).fetchone()
+            return _CacheStats(self.hits, self.misses, self.coalesced,
+                               self.maxsize, count)
+
+    def clear(self):
+        '''Remove the results of the namespace and clear the statistics.'''
+        with self.lock:
+            with self.connection as conn:
+                conn.execute('DELETE FROM memo WHERE namespace = ?',
+                             (self.namespace, ))
+            if self.memory:
+                self.memory.clear()
+            self.used.clear()
+            self.hits = self.misses = self.coalesced = 0
+
+
+def _blob(value):
+    '''Return `value` (bytes) as a sqlite BLOB.'''
+    try:
+        return buffer(value)    # Python 2 stores `str` as TEXT
+    except NameError:
+        return value
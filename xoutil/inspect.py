@@ -23,6 +23,10 @@ from __future__ import (division as _py3_division,
                         absolute_import as _absolute_import)
 
 
+from six import PY3 as _PY3
+
+from xoutil._values import Undefined as _undef
+from xoutil.tools import get_default as _get_default
 from xoutil.modules import copy_members as _copy_python_module_members
 _pm = _copy_python_module_members()
 types = _pm.types
@@ -39,6 +43,8 @@ except NameError:
 
 try:
     getattr_static = _pm.getattr_static
+    _shadowed_dict = _pm._shadowed_dict
+    _sentinel = _pm._sentinel
 except AttributeError:
     # Copied from `/usr/lib/python3.3/inspect.py`
 
@@ -175,6 +181,112 @@ except AttributeError:
             raise AttributeError(attr)
 
 
+from weakref import ref as _weakref
+
+_type_mro = type.__dict__['__mro__'].__get__
+_type_dict = type.__dict__['__dict__'].__get__
+
+try:
+    _OLD_STYLE = (types.InstanceType, types.ClassType)
+except AttributeError:
+    _OLD_STYLE = ()
+
+# What `getattr_static` needs to know about new-style classes:
+# ``{id(class): (ref, bases, own, dicts, instance)}``.  `bases` is the MRO
+# without the class, to detect changes of ``__bases__``; `own` is True if the
+# class' dict is searched; `dicts` has the dicts of the bases that are
+# searched (not the class' dict, so the entry doesn't keep the class alive);
+# and `instance` is True if the instances' ``__dict__`` is searched.
+#
+# The dicts are live views: names are always looked up in the current
+# namespaces, so entries need not be dropped when the classes change.
+_static_types = {}
+
+
+def _static_type(klass):
+    mro = _type_mro(klass)
+    entry = _static_types.get(id(klass))
+    if entry is None or entry[0]() is not klass or entry[1] != mro[1:]:
+        key = id(klass)
+        visible = [_shadowed_dict(type(base)) is _sentinel for base in mro]
+        dict_attr = _shadowed_dict(klass)
+        entry = (_weakref(klass, lambda r: _static_types.pop(key, None)),
+                 mro[1:], visible[0],
+                 tuple(_type_dict(base)
+                       for base, searched in zip(mro[1:], visible[1:])
+                       if searched),
+                 dict_attr is _sentinel or
+                 type(dict_attr) is types.MemberDescriptorType)
+        _static_types[key] = entry
+    return entry
+
+
+def _static_class_lookup(klass, attr, entry=None):
+    _ref, _bases, own, dicts, _instance = entry or _static_type(klass)
+    if own:
+        res = _type_dict(klass).get(attr, _sentinel)
+        if res is not _sentinel:
+            return res
+    for namespace in dicts:
+        res = namespace.get(attr, _sentinel)
+        if res is not _sentinel:
+            return res
+    return _sentinel
+
+
+def _static_lookup(obj, attr, default=_sentinel):
+    '''The same as `getattr_static` but reusing what's known of the types.'''
+    if isinstance(obj, _OLD_STYLE):
+        return getattr_static(obj, attr, default)
+    klass = type(obj)
+    instance_result = _sentinel
+    if type in _type_mro(klass):
+        klass = obj
+        entry = _static_type(klass)
+    else:
+        entry = _static_type(klass)
+        if entry[4]:
+            try:
+                instance_dict = object.__getattribute__(obj, '__dict__')
+            except AttributeError:
+                instance_dict = {}
+            instance_result = dict.get(instance_dict, attr, _sentinel)
+    klass_result = _static_class_lookup(klass, attr, entry)
+    if instance_result is not _sentinel and klass_result is not _sentinel:
+        descriptor = type(klass_result)
+        if (_static_class_lookup(descriptor, '__get__') is not _sentinel and
+                _static_class_lookup(descriptor, '__set__') is not _sentinel):
+            return klass_result
+    if instance_result is not _sentinel:
+        return instance_result
+    if klass_result is not _sentinel:
+        return klass_result
+    if obj is klass:
+        # for types we check the metaclass too
+        res = _static_class_lookup(type(klass), attr)
+        if res is not _sentinel:
+            return res
+    if default is not _sentinel:
+        return default
+    else:
+        raise AttributeError(attr)
+
+
+if _PY3:
+    def _isdatadescriptor(obj):
+        '''The same as `isdatadescriptor`, but faster for values whose type
+        has neither ``__set__`` nor ``__delete__``.'''
+        tp = type(obj)
+        if (getattr(tp, '__set__', _sentinel) is _sentinel and
+                getattr(tp, '__delete__', _sentinel) is _sentinel):
+            return False
+        else:
+            return isdatadescriptor(obj)
+else:
+    # Python 2 looks for ``__get__`` and ``__set__`` in the object itself.
+    _isdatadescriptor = isdatadescriptor
+
+
 def get_attr_value(obj, name, *default):
     '''Get a named attribute from an object in a safe way.
 
@@ -183,12 +295,10 @@ def get_attr_value(obj, name, *default):
     `getattr_static`:func:.
 
     '''
-    from xoutil import Undefined as _undef
-    from xoutil.tools import get_default
-    default = get_default(default, _undef)
+    default = _get_default(default, _undef)
     is_type = isinstance(obj, type)
-    res = getattr_static(obj, name, _undef)
-    if isdatadescriptor(res):
+    res = _static_lookup(obj, name, _undef)
+    if _isdatadescriptor(res):
         try:
             owner = type if is_type else type(obj)
             res = res.__get__(obj, owner)
@@ -196,8 +306,8 @@ def get_attr_value(obj, name, *default):
             res = _undef
     if res is _undef and not is_type:
         cls = type(obj)
-        res = getattr_static(cls, name, _undef)
-        if isdatadescriptor(res):
+        res = _static_lookup(cls, name, _undef)
+        if _isdatadescriptor(res):
             try:
                 res = res.__get__(obj, cls)
             except StandardException:
@@ -211,6 +211,12 @@ class SafeDataItem(object):
 
     def __get__(self, obj, owner):
         if obj is not None:
+            try:
+                # The inner slot (or `__dict__` item) is not dynamic, so this
+                # is safe and much faster than `get_attr_value`.
+                return object.__getattribute__(obj, self.inner_name)
+            except AttributeError:
+                pass
             from xoutil.inspect import get_attr_value
             res = get_attr_value(obj, self.inner_name, Unset)
             if res is not Unset:
@@ -530,22 +536,87 @@ def fix_method_documentation(cls, method_name, ignore=None, min_length=10,
             method.__doc__ = default(cls) if callable(default) else default
 
 
+from weakref import WeakKeyDictionary as _WeakKeyDictionary
+
+# The names `dir` lists for types: ``{type: (bases, sizes, names, sorted)}``.
+# `bases` is the MRO without the type itself (so the entry doesn't keep the
+# type alive) and `sizes` the number of names in the dict of each class in
+# the MRO: the listing is valid while both are the same.  (Replacing a class
+# attribute by another one between two listings is not noticed.)
+_type_names = _WeakKeyDictionary()
+_TYPE_DIR = getattr(type, '__dir__', None)
+_OBJECT_DIR = getattr(object, '__dir__', None)
+
+
+def _dir_type(cls):
+    '''Return the names `dir` lists for the type `cls` as a pair ``(set,
+    sorted tuple)``, or None if `dir` is customized for `cls`.
+
+    '''
+    if getattr(type(cls), '__dir__', None) is not _TYPE_DIR:
+        return None
+    mro = cls.__mro__
+    sizes = tuple(map(len, map(vars, mro)))
+    entry = _type_names.get(cls)
+    if entry is not None:
+        bases, known, names, ordered = entry
+        if known == sizes and bases == mro[1:]:
+            return names, ordered
+    ordered = tuple(dir(cls))
+    names = frozenset(ordered)
+    _type_names[cls] = (mro[1:], sizes, names, ordered)
+    return names, ordered
+
+
+def _dir(obj):
+    '''The same as `dir(obj)` but reusing the names of the types.'''
+    if isinstance(obj, type):
+        names = _dir_type(obj)
+        if names is not None:
+            return names[1]
+    elif _OBJECT_DIR is not None:
+        cls = type(obj)
+        if (getattr(cls, '__dir__', None) is _OBJECT_DIR and
+                getattr(obj, '__class__', None) is cls):
+            names = _dir_type(cls)
+            attrs = getattr(obj, '__dict__', {})
+            if names is not None and isinstance(attrs, dict):
+                names, ordered = names
+                if not attrs:
+                    return ordered
+                elif len(attrs) > 16:
+                    return sorted(names.union(attrs))
+                else:
+                    from bisect import insort
+                    res = list(ordered)
+                    for attr in attrs:
+                        if attr not in names:
+                            insort(res, attr)
+                    return res
+    return dir(obj)
+
+
 def fulldir(obj):
     '''Return a set with all attribute names defined in `obj`'''
-    res = set()
-    if isinstance(obj, type):
-        for cls in type.mro(obj):
-            res |= set(SafeDataItem.getattr(cls, '__dict__', {}))
-    else:
-        res |= set(SafeDataItem.getattr(obj, '__dict__', {}))
     cls = type(obj)
+    names = _dir_type(obj) if isinstance(obj, type) else None
+    if names is not None:
+        res = set(names[0])
+    elif isinstance(obj, type):
+        res = set()
+        for base in type.mro(obj):
+            res |= set(getattr(base, '__dict__', {}))
+    else:
+        res = set(getattr(obj, '__dict__', {}))
     if cls is not type:
-        res |= set(dir(cls))
+        names = _dir_type(cls)
+        res |= names[0] if names is not None else set(dir(cls))
     return res
 
 
 # TODO: Fix signature after removal of attr_filter and value_filter
-def xdir(obj, attr_filter=None, value_filter=None, getter=None, filter=None, _depth=0):
+def xdir(obj, attr_filter=None, value_filter=None, getter=None, filter=None,
+         _depth=0, _names=False):
     '''Return all ``(attr, value)`` pairs from `obj` that ``attr_filter(attr)``
     and ``value_filter(value)`` are both True.
 
@@ -573,7 +644,7 @@ def xdir(obj, attr_filter=None, value_filter=None, getter=None, filter=None, _de
 
     '''
     getter = getter or getattr
-    attrs = dir(obj)
+    attrs = _dir(obj)
     if attr_filter or value_filter:
         import warnings
         msg = ('Arguments of `attr_filter` and `value_filter` are deprecated. '
@@ -582,26 +653,41 @@ def xdir(obj, attr_filter=None, value_filter=None, getter=None, filter=None, _de
     if filter:
         attr_filter = None
         value_filter = None
-    if attr_filter:
-        attrs = (attr for attr in attrs if attr_filter(attr))
-    res = ((a, getter(obj, a)) for a in attrs)
-    if value_filter:
-        res = ((a, v) for a, v in res if value_filter(v))
-    if filter:
-        res = ((a, v) for a, v in res if filter(a, v))
-    return res
+    return _iter_attrs(obj, attrs, getter, attr_filter or None,
+                       value_filter or None, filter or None, _names)
+
+
+def _iter_attrs(obj, attrs, getter, attr_filter, value_filter, filter,
+                names):
+    if attr_filter is value_filter is filter is None:
+        res = ((attr, getter(obj, attr)) for attr in attrs)
+        return (attr for attr, _value in res) if names else res
+    else:
+        return _iter_filtered(obj, attrs, getter, attr_filter, value_filter,
+                              filter, names)
+
+
+def _iter_filtered(obj, attrs, getter, attr_filter, value_filter, filter,
+                   names):
+    for attr in attrs:
+        if attr_filter is None or attr_filter(attr):
+            value = getter(obj, attr)
+            if value_filter is not None and not value_filter(value):
+                continue
+            if filter is None or filter(attr, value):
+                yield attr if names else (attr, value)
 
 
 # TODO: Fix signature after removal of attr_filter and value_filter
 def fdir(obj, attr_filter=None, value_filter=None, getter=None, filter=None):
     '''Similar to :func:`xdir` but yields only the attributes names.'''
-    full = xdir(obj,
+    return xdir(obj,
                 filter=filter,
                 attr_filter=attr_filter,
                 value_filter=value_filter,
                 getter=getter,
-                _depth=1)
-    return (attr for attr, _v in full)
+                _depth=1,
+                _names=True)
 
 
 def validate_attrs(source, target, force_equals=(), force_differents=()):
@@ -1106,7 +1192,7 @@ def smart_copy(*args, **kwargs):
                     raise KeyError(key)
             setter(key, val)
     else:
-        keys = []
+        keys = set()
         for source in sources:
             get = smart_getter(source)
             if isinstance(source, (Mapping, DictProxyType)):
@@ -1122,12 +1208,111 @@ def smart_copy(*args, **kwargs):
                 else:
                     copy = True
                 if key not in keys:
-                    keys.append(key)
+                    keys.add(key)
                     if copy:
                         setter(key, get(key))
     return target
 
 
+def smart_copier(source_type, target_type, defaults=False):
+    '''Return a function ``copy(source, target)`` that does the same as
+    ``smart_copy(source, target, defaults=defaults)``.
+
+    Everything that only depends on `source_type`, `target_type` and
+    `defaults` is resolved once: whether the source is read by key or
+    attribute, whether the target is written by key or attribute, which keys
+    are valid identifiers and, if `defaults` is a mapping or an iterable, the
+    list of keys with its fallback values.  Use it when the same kind of copy
+    is done repeatedly::
+
+        >>> class Person(object):
+        ...     pass
+
+        >>> copy = smart_copier(dict, Person, defaults={'name': None})
+        >>> copy({'name': 'John', 'age': 42}, Person()).name
+        'John'
+
+    :param source_type: The type of the (single) source object.
+
+    :param target_type: The type of the target object.
+
+    :param defaults: As in `smart_copy`:func:.  If it's a mapping or an
+                     iterable, it's read only once.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    from collections import Mapping, MutableMapping
+    from xoutil.types import is_collection, Required
+    from xoutil.types import DictProxyType
+    from xoutil.data import adapt_exception
+    from xoutil.validators.identifiers import is_valid_identifier
+    if defaults is None:
+        defaults = False
+    if issubclass(target_type, (bool, type(None), int, float) + str_base):
+        raise TypeError('target should be a mutable object, not %s' %
+                        target_type)
+    target_is_mapping = issubclass(target_type, MutableMapping)
+    source_is_mapping = issubclass(source_type, (Mapping, DictProxyType))
+    if source_is_mapping:
+        get = lambda source, key, default: source.get(key, default)
+    else:
+        get = getattr
+    is_mapping = isinstance(defaults, Mapping)
+    if is_mapping or is_collection(defaults):
+        required = object()
+        plan = []
+        for key in defaults:
+            val = defaults.get(key, None) if is_mapping else None
+            if adapt_exception(val, key=key) or val is Required or \
+               isinstance(val, Required):
+                val = required
+            if target_is_mapping or is_valid_identifier(key):
+                plan.append((key, val, True))
+            elif val is required:
+                plan.append((key, val, False))
+        plan = tuple(plan)
+
+        def copy(source, target):
+            for key, fallback, settable in plan:
+                val = get(source, key, Unset)
+                if val is Unset:
+                    if fallback is required:
+                        raise KeyError(key)
+                    val = fallback
+                if not settable:
+                    pass
+                elif target_is_mapping:
+                    target[key] = val
+                else:
+                    setattr(target, key, val)
+            return target
+    else:
+        valid_identifiers = {}
+        public_only = defaults is False
+        accept = defaults if not public_only and callable(defaults) else None
+
+        def copy(source, target):
+            keys = source if source_is_mapping else dir(source)
+            for key in keys:
+                if public_only:
+                    if isinstance(key, str_base) and key.startswith('_'):
+                        continue
+                elif accept and not accept(key, source=source):
+                    continue
+                if target_is_mapping:
+                    target[key] = get(source, key, None)
+                else:
+                    valid = valid_identifiers.get(key)
+                    if valid is None:
+                        valid = bool(is_valid_identifier(key))
+                        valid_identifiers[key] = valid
+                    if valid:
+                        setattr(target, key, get(source, key, None))
+            return target
+    return copy
+
+
 def extract_attrs(obj, *names, **kwargs):
     '''Extracts all `names` from an object.
 
@@ -1296,6 +1481,78 @@ def register_with(abc):
     return inner
 
 
+from xoutil.functools import lru_cache as _lru_cache  # noqa
+
+# Maps a type to whether its instances are traversed as mappings (``.get``)
+# or by attributes (``getattr``).  See `_compile_traverser`:func:.
+_traverse_kinds = {}
+
+
+def _is_traverse_mapping(obj):
+    '''Tell if `obj` should be traversed as a mapping.
+
+    The verdict is cached per type, so a class registered as a `Mapping` after
+    it was traversed is not noticed until `_traverse_kinds` is cleared.
+
+    '''
+    from collections import Mapping
+    from xoutil.types import DictProxyType
+    cls = type(obj)
+    res = _traverse_kinds.get(cls)
+    if res is None:
+        res = _traverse_kinds[cls] = isinstance(obj, (DictProxyType, Mapping))
+    return res
+
+
+@_lru_cache(maxsize=512)
+def _compile_traverser(path, sep='.', getter=None):
+    '''Compile a single `path` into a function ``(obj, default=Unset)``.
+
+    The `path` is split only once and the result is cached (bounded LRU) by
+    ``(path, sep, getter)``; so `traverse`:func: and `get_traverser`:func: pay
+    the compilation once per distinct path.
+
+    Without a `getter` each hop picks either ``.get`` or ``getattr`` according
+    to the type of the current object (the same choice `smart_getter`:func:
+    does), but without building a getter closure per hop.
+
+    '''
+    attrs = tuple(path.split(sep))
+    kinds = _traverse_kinds
+    is_mapping = _is_traverse_mapping
+    found = object()
+
+    if getter:
+        def inner(obj, default=Unset):
+            current = obj
+            for attr in attrs:
+                current = getter(current, attr, found)
+                if current is found:
+                    if default is Unset:
+                        raise AttributeError(attr)
+                    else:
+                        return default
+            return current
+    else:
+        def inner(obj, default=Unset):
+            current = obj
+            for attr in attrs:
+                mapping = kinds.get(type(current))
+                if mapping is None:
+                    mapping = is_mapping(current)
+                if mapping:
+                    current = current.get(attr, found)
+                else:
+                    current = getattr(current, attr, found)
+                if current is found:
+                    if default is Unset:
+                        raise AttributeError(attr)
+                    else:
+                        return default
+            return current
+    return inner
+
+
 def traverse(obj, path, default=Unset, sep='.', getter=None):
     '''Traverses an object's hierarchy by performing an attribute get at each
     level.
@@ -1319,9 +1576,11 @@ def traverse(obj, path, default=Unset, sep='.', getter=None):
 
         get_traverser(path, default=default, sep=sep, getter=getter)(obj)
 
+    .. versionchanged:: 1.7.0 The path is compiled once and cached, and the
+       `getter` argument is no longer ignored.
+
     '''
-    _traverser = get_traverser(path, default=default, sep=sep, getter=None)
-    return _traverser(obj)
+    return _compile_traverser(path, sep, getter)(obj, default)
 
 
 def get_traverser(*paths, **kw):
@@ -1337,35 +1596,29 @@ def get_traverser(*paths, **kw):
 
     .. versionadded:: 1.5.3
 
-    '''
-    def _traverser(path, default=Unset, sep='.', getter=None):
-        if not getter:
-            getter = lambda o, a, default=None: smart_getter(o)(a, default)
-
-        def inner(obj):
-            found = object()
-            current = obj
-            attrs = path.split(sep)
-            while current is not found and attrs:
-                attr = attrs.pop(0)
-                current = getter(current, attr, found)
-            if current is found:
-                if default is Unset:
-                    raise AttributeError(attr)
-                else:
-                    return default
-            else:
-                return current
-
-        return inner
+    .. versionchanged:: 1.7.0 Each path is compiled only once (split and
+       cached in a bounded LRU keyed by ``(path, sep, getter)``), and each hop
+       accesses mappings by key and other objects by attribute without
+       building intermediate getters.
 
+    '''
+    from functools import partial
+    default = kw.pop('default', Unset)
+    sep = kw.pop('sep', '.')
+    getter = kw.pop('getter', None)
+    if kw:
+        raise TypeError('Invalid keyword arguments for `get_traverser`: %s'
+                        % ', '.join(kw))
     if len(paths) == 1:
-        result = _traverser(paths[0], **kw)
+        result = _compile_traverser(paths[0], sep, getter)
+        if default is not Unset:
+            result = partial(result, default=default)
     elif len(paths) > 1:
-        _traversers = tuple(_traverser(path, **kw) for path in paths)
+        _traversers = tuple(_compile_traverser(path, sep, getter)
+                            for path in paths)
 
         def _result(obj):
-            return tuple(traverse(obj) for traverse in _traversers)
+            return tuple([traverse(obj, default) for traverse in _traversers])
 
         result = _result
     else:
@@ -1373,8 +1626,117 @@ def get_traverser(*paths, **kw):
     return result
 
 
-def dict_merge(*dicts, **others):
+def traverse_columns(objs, *paths, **kw):
+    '''Traverse every object in `objs` and collect the values by `path`.
+
+    This is the column-oriented counterpart of `get_traverser`:func:.
+    Instead of a tuple per object, return a list per path with the values
+    found for each object (in the order of `objs`)::
+
+        >>> rows = [{'a': {'b': 1}, 'c': 'x'}, {'a': {'b': 2}, 'c': 'y'}]
+        >>> traverse_columns(rows, 'a.b')
+        [1, 2]
+
+        >>> traverse_columns(rows, 'a.b', 'c') == ([1, 2], ['x', 'y'])
+        True
+
+    :param objs: An iterable of objects.  If it's not a sequence and several
+                 `paths` are given, it's consumed into a list first.
+
+    :param paths: Several paths to extract.
+
+    :param typecodes: *optional* A sequence with an `array`:mod: type code
+                      (or None) for each path.  Columns with a type code are
+                      returned as an ``array.array`` instead of a list.
 
+    The keyword arguments `default`, `sep` and `getter` have the same meaning
+    as in `traverse`:func:.
+
+    :returns: A single column if only one path is given, otherwise a tuple
+              with a column per path.
+
+    .. versionadded:: 1.7.0
+
+    '''
+    from collections import Sequence
+    from itertools import repeat
+    from six.moves import map
+    default = kw.pop('default', Unset)
+    sep = kw.pop('sep', '.')
+    getter = kw.pop('getter', None)
+    typecodes = kw.pop('typecodes', None)
+    if kw:
+        raise TypeError('Invalid keyword arguments for `traverse_columns`: '
+                        '%s' % ', '.join(kw))
+    if not paths:
+        raise TypeError('"traverse_columns" requires at least a path')
+    if typecodes is None:
+        typecodes = (None, ) * len(paths)
+    elif len(typecodes) != len(paths):
+        raise TypeError('"typecodes" must have a type code for each path')
+    if len(paths) > 1 and not isinstance(objs, Sequence):
+        objs = list(objs)
+    result = []
+    for path, typecode in zip(paths, typecodes):
+        traverser = _compile_traverser(path, sep, getter)
+        if default is Unset:
+            values = map(traverser, objs)
+        else:
+            values = map(traverser, objs, repeat(default))
+        if typecode:
+            from array import array
+            result.append(array(str(typecode), values))
+        else:
+            result.append(list(values))
+    return result[0] if len(paths) == 1 else tuple(result)
+
+
+class _Collisions(list):
+    '''The values found for a single key in several merged mappings.'''
+    __slots__ = ()
+
+
+def _merge_values(key, values, merge_mappings):
+    '''Merge the `values` (at least two) found for `key` by `dict_merge`.
+
+    If all `values` are mappings, return ``merge_mappings(values)``.
+    Sequences and sets are joined in a single pass when the type of the first
+    value is a built-in one.
+
+    '''
+    from collections import Mapping, Sequence, Set
+    from itertools import chain
+    collections = (Set, Sequence)
+    first = values[0]
+    if isinstance(first, collections):
+        if not all(isinstance(val, collections) for val in values):
+            raise TypeError("Found incompatible values for key '%s'" % key)
+        constructor = type(first)
+        if constructor in (list, tuple):
+            return constructor(chain.from_iterable(values))
+        elif constructor in (set, frozenset):
+            return first.union(*values)
+        else:
+            value = first
+            for val in values[1:]:
+                join = get_first_of((value, ), '__add__', '__or__')
+                if join:
+                    constructor = type(value)
+                    value = join(constructor(val))
+                else:
+                    raise ValueError("Invalid value for key '%s'" % key)
+            return value
+    elif isinstance(first, Mapping):
+        if not all(isinstance(val, Mapping) for val in values):
+            raise TypeError("Found incompatible values for key '%s'" % key)
+        return merge_mappings(values)
+    elif any(isinstance(val, collections + (Mapping, )) for val in values):
+        raise TypeError("Found incompatible values for key '%s'" % key)
+    else:
+        return values[-1]
+
+
+def dict_merge(*dicts, **others):
     '''Merges several dicts into a single one.
 
     Merging is similar to updating a dict, but if values are non-scalars they
@@ -1396,37 +1758,43 @@ def dict_merge(*dicts, **others):
 
     Without arguments, return the empty dict.
 
+    .. versionchanged:: 1.7.0 Nested mappings are merged iteratively (no
+       recursion) and all the values for a key are joined at once instead of
+       pair by pair.  Nested mappings found in a single place are still
+       copied (shallowly), since the result may be modified.  See
+       `xoutil.collections.MergedView`:class: for a lazy alternative that
+       shares them.
+
     '''
-    from collections import Mapping, Sequence, Set
+    from collections import Mapping
     from six import iteritems as iteritems_
-    from xoutil.objects import get_first_of
-    from xoutil.types import are_instances, no_instances
     if others:
         dicts = dicts + (others, )
-    dicts = list(dicts)
     result = {}
-    collections = (Set, Sequence)
-    while dicts:
-        current = dicts.pop(0)
-        for key, val in iteritems_(current):
-            if isinstance(val, Mapping):
-                val = {key: val[key] for key in val}
-            value = result.setdefault(key, val)
-            if value is not val:
-                if are_instances(value, val, collections):
-                    join = get_first_of((value, ), '__add__', '__or__')
-                    if join:
-                        constructor = type(value)
-                        value = join(constructor(val))
-                    else:
-                        raise ValueError("Invalid value for key '%s'"
-                                         % key)
-                elif are_instances(value, val, Mapping):
-                    value = dict_merge(value, val)
-                elif no_instances(value, val, (Set, Sequence, Mapping)):
-                    value = val
-                else:
-                    raise TypeError("Found incompatible values for key '%s'"
-                                    % key)
-                result[key] = value
+    pending = [(result, dicts)]
+
+    def merge_mappings(values):
+        res = {}
+        pending.append((res, values))
+        return res
+
+    missing = object()
+    while pending:
+        target, sources = pending.pop()
+        found = {}
+        for source in sources:
+            for key, val in iteritems_(source):
+                current = found.get(key, missing)
+                if current is missing:
+                    found[key] = val
+                elif type(current) is _Collisions:
+                    current.append(val)
+                elif current is not val:
+                    found[key] = _Collisions((current, val))
+        for key, val in iteritems_(found):
+            if type(val) is _Collisions:
+                val = _merge_values(key, val, merge_mappings)
+            elif isinstance(val, Mapping):
+                val = {k: val[k] for k in val}
+            target[key] = val
     return result
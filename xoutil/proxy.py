@@ -30,6 +30,9 @@ from __future__ import (division as _py3_division,
                         unicode_literals as _py3_unicode,
                         absolute_import as _py3_abs_import)
 
+from functools import partial
+from weakref import WeakKeyDictionary
+
 from xoutil import Unset
 from xoutil.context import context
 from xoutil.aop import complementor
@@ -80,8 +83,9 @@ SUPPORTED_OPERATIONS = (SUPPORTED_UNARY_OPERATIONS +
 
 def build_self_operator(method_name):
     def method(self):
-        with context(UNPROXIFING_CONTEXT):
-            _super = getattr(self, '_super_%s' % method_name, None)
+        # Proxies never unproxify the '_super_' attributes, there's no need
+        # to enter the UNPROXIFING_CONTEXT.
+        _super = getattr(self, '_super_%s' % method_name, None)
         if _super:
             return _super()
         else:
@@ -92,8 +96,7 @@ def build_self_operator(method_name):
 
 def build_binary_operator(method_name):
     def method(self, other):
-        with context(UNPROXIFING_CONTEXT):
-            _super = getattr(self, '_super_%s' % method_name, None)
+        _super = getattr(self, '_super_%s' % method_name, None)
         if _super:
             return _super(other)
         else:
@@ -127,37 +130,56 @@ def _mro_getattr(obj, attr, default=Unset):
         return res
 
 
+# The attributes of proxies provided by their behaviors: ``{proxy class:
+# (getattribute, {(behaves, attr): method or None})}``, `getattribute` is the
+# ``__getattribute__`` of the bases of the proxy class.
+_dispatchers = WeakKeyDictionary()
+
+
+def _dispatcher(cls):
+    res = _dispatchers.get(cls)
+    if res is None:
+        getattribute = next(base.__dict__['__getattribute__']
+                            for base in cls.__mro__[1:]
+                            if '__getattribute__' in base.__dict__)
+        res = _dispatchers[cls] = (getattribute, {})
+    return res
+
+
+def _behavior_method(behaves, attr):
+    '''Return the function implementing `attr` in the first of `behaves`
+    that has it as an instance method, or None.'''
+    from xoutil.types import is_instancemethod
+    wrapper = next((b for b in behaves if is_instancemethod(b, attr)), None)
+    return _mro_getattr(wrapper, attr) if wrapper else None
+
+
 class Proxy(object):
     '''A complementor for a "behavior" defined in query expressions or a target
     object.
 
+    Which behavior (if any) provides an attribute is resolved once for each
+    proxy class, `behaves` and attribute name, so the behavior classes
+    should not change after their proxies are used.
+
     '''
     def __getattribute__(self, attr):
-        from functools import partial
-        from xoutil.types import is_instancemethod
-
-        def get(name, default=Unset):
-            _get = super(type(self), self).__getattribute__
-            try:
-                return _get(name)
-            except AttributeError:
-                if default is not Unset:
-                    return default
-                else:
-                    raise
-
+        getattribute, methods = _dispatcher(type(self))
         # TODO: Review why the second condition is necessary.
         if context[UNPROXIFING_CONTEXT] and not attr.startswith('_super_'):
-            return get(attr)
-        target = get('target')
-        behaves = get('behaves', None)
-        if not behaves:
-            behaves = ()
-        valid_wrapper = lambda b: is_instancemethod(b, attr)
-        wrapper = next((b for b in behaves if valid_wrapper(b)), None)
-        if wrapper:
-            result = _mro_getattr(wrapper, attr)
-            return partial(result, self)
+            return getattribute(self, attr)
+        target = getattribute(self, 'target')
+        try:
+            behaves = getattribute(self, 'behaves')
+        except AttributeError:
+            behaves = None
+        key = (tuple(behaves) if behaves else (), attr)
+        try:
+            method = methods[key]
+        except KeyError:
+            method = methods[key] = _behavior_method(key[0], attr)
+        if method is not None:
+            return method.__get__(self, type(self))
         else:
             unset = object()
             result = getattr(target, attr, unset)
@@ -168,7 +190,7 @@ class Proxy(object):
                 elif attr == '__ne__':
                     return partial(lambda s, o: s is not o, self)
                 elif attr == '__deepcopy__':
-                    return get('__deepcopy__')
+                    return getattribute(self, '__deepcopy__')
                 elif attr == 'target':
                     # Allow behaviors to access target attr.
                     return target
@@ -28,6 +28,7 @@ from __future__ import (division as _py3_division,
 
 
 from xoutil import Unset
+from xoutil._values import UnsetType as _UnsetType
 from xoutil.functools import lru_cache
 from xoutil.objects import metaclass
 
@@ -97,20 +98,180 @@ class _record_type(type):
         result._rec_index = index
         return result
 
-    def get_field(self, raw_data, field):
-        from xoutil import Undefined
-        field_name = self._rec_index[field]
+    def __setattr__(self, attr, value):
+        super(_record_type, self).__setattr__(attr, value)
+        if attr.endswith('_reader'):
+            self._clear_readers()
+
+    def __delattr__(self, attr):
+        super(_record_type, self).__delattr__(attr)
+        if attr.endswith('_reader'):
+            self._clear_readers()
+
+    def _clear_readers(self):
+        '''Forget the readers cached by `get_reader` in this class and its
+        subclasses.'''
+        pending = [self]
+        while pending:
+            cls = pending.pop()
+            cls.__dict__.get('_rec_readers', {}).clear()
+            pending.extend(type.__subclasses__(cls))
+
+    def get_reader(self, field):
+        '''Return the reader for `field` or None if it has no reader.
+
+        Readers are looked up once per class and field.
+
+        '''
+        readers = self.__dict__.get('_rec_readers')
+        if readers is None:
+            readers = {}
+            type.__setattr__(self, str('_rec_readers'), readers)
         try:
-            value = raw_data[field]
-        except (IndexError, KeyError):
-            value = Undefined
-        reader_name = '_%s_reader' % field_name.lower()
-        reader = getattr(self, reader_name, None)
+            return readers[field]
+        except KeyError:
+            field_name = self._rec_index[field]
+            reader_name = '_%s_reader' % field_name.lower()
+            res = readers[field] = getattr(self, reader_name, None)
+            return res
+
+    def get_field(self, raw_data, field):
+        reader = self.get_reader(field)
+        value = _get_value(raw_data, field)
         if reader:
             return reader(value)
         else:
             return value
 
+    def read_many(self, rows, fields=None, numeric=None):
+        '''Read whole `rows` in a column-oriented way.
+
+        :param rows: An iterable of lines (as provided by the external
+                     source).
+
+        :param fields: *optional* The fields (as in `get_field`) to read.
+                       Defaults to all the fields of the record.
+
+        :param numeric: How to return the columns of fields whose reader
+                        produces fixed-size numbers (see `float_reader`:func:
+                        and `integer_reader`:func:).  If None they are lists
+                        like the others, if 'array' they are
+                        ``array.array``, if 'numpy' they are NumPy arrays
+                        (NumPy must be installed).  Columns with numbers
+                        that don't fit in the type code are left as lists.
+
+        :returns: A dict from lowercase field names (the names of instance
+                  attributes) to the list of values read for each row.
+
+        .. versionadded:: 1.7.0
+
+        '''
+        from collections import Sequence
+        from operator import itemgetter
+        from six.moves import map
+        if numeric not in (None, 'array', 'numpy'):
+            raise ValueError("numeric must be None, 'array' or 'numpy'")
+        if not isinstance(rows, Sequence):
+            rows = list(rows)
+        if fields is None:
+            fields = list(self._rec_index)
+        result = {}
+        for field in fields:
+            reader = self.get_reader(field)
+            try:
+                values = list(map(itemgetter(field), rows))
+            except (IndexError, KeyError):
+                values = [_get_value(row, field) for row in rows]
+            if reader:
+                values = list(map(reader, values))
+            typecode = numeric and getattr(reader, 'typecode', None)
+            column = values
+            if typecode:
+                try:
+                    if numeric == 'array':
+                        from array import array
+                        column = array(str(typecode), values)
+                    else:
+                        import numpy
+                        column = numpy.array(values, dtype=typecode)
+                except OverflowError:
+                    pass    # Keep the list
+            result[self._rec_index[field].lower()] = column
+        return result
+
+    def read_csv(self, source, chunksize=10000, fields=None, numeric=None,
+                 processes=None, **kwargs):
+        '''Read a CSV file in batches of at most `chunksize` lines.
+
+        Each batch is the result of `read_many` for those lines, so memory is
+        bounded by the size of the batch no matter the size of the file.
+
+        :param source: Either a file name or an open (text) file object.  If
+                       a file name, the file is opened and closed here.
+
+        :param chunksize: The maximum number of lines of each batch.
+
+        :param fields: Passed to `read_many`.
+
+        :param numeric: Passed to `read_many`.
+
+        :param processes: If not None, the readers are run in a pool of that
+                          many processes (the lines are parsed in this
+                          process).  The record class must be importable by
+                          the workers (i.e. not defined inside a function).
+                          Batches are still yielded in order and at most two
+                          batches per process are in flight.
+
+        Other keyword arguments are passed to `csv.reader`:func:.  If any
+        field is a string the lines are read as dicts with
+        `csv.DictReader`:class: (the first line is the header).
+
+        .. versionadded:: 1.7.0
+
+        '''
+        import csv
+        from itertools import islice
+        from six import PY3, string_types
+        if isinstance(source, string_types):
+            if PY3:
+                stream = open(source, newline='')
+            else:
+                stream = open(source, 'rb')
+        else:
+            stream = source
+        try:
+            if any(isinstance(f, string_types) for f in self._rec_index):
+                lines = csv.DictReader(stream, **kwargs)
+            else:
+                lines = csv.reader(stream, **kwargs)
+            chunks = iter(lambda: list(islice(lines, chunksize)), [])
+            if processes is None:
+                for chunk in chunks:
+                    yield self.read_many(chunk, fields, numeric)
+            else:
+                from collections import deque
+                from multiprocessing import Pool
+                pool = Pool(processes)
+                try:
+                    pending = deque()
+                    for chunk in chunks:
+                        args = (self, chunk, fields, numeric)
+                        pending.append(pool.apply_async(_read_many, args))
+                        if len(pending) >= 2 * processes:
+                            yield pending.popleft().get()
+                    while pending:
+                        yield pending.popleft().get()
+                finally:
+                    pool.terminate()
+        finally:
+            if stream is not source:
+                stream.close()
+
+
+def _read_many(rec, rows, fields, numeric):
+    '''Run `rec.read_many` in a worker of `record.read_csv`.'''
+    return rec.read_many(rows, fields, numeric)
+
 
 class record(metaclass(_record_type)):
     '''Base record class.
@@ -173,6 +334,16 @@ class record(metaclass(_record_type)):
         datetime.datetime(2014, 2, 17, 17, 29, 21, 965053)
 
 
+    To read many lines at once use the classmethod `read_many`, it returns
+    the values by column (a dict from attribute names to lists)::
+
+        >>> lines = [(1, 'AA20X138874Z012'), (2, 'AA20X138874Z013')]
+        >>> INVOICE.read_many(lines)['reference']
+        ['AA20X138874Z012', 'AA20X138874Z013']
+
+    The classmethod `read_csv` streams a whole CSV file as a sequence of
+    such batches.
+
     .. warning:: Creating readers for fields defined in super classes is not
        directly supported.  To do so, you **must** declare the reader as a
        staticmethod yourself.
@@ -207,8 +378,7 @@ def isnull(val):
     valid number) are not misinterpreted as null.
 
     '''
-    from xoutil._values import UnsetType
-    return val in (None, '') or isinstance(val, UnsetType)
+    return val in (None, '') or isinstance(val, _UnsetType)
 
 
 # Standard readers
@@ -229,8 +399,61 @@ def check_nullable(val, nullable):
         raise ValueError('NULL value was not expected here')
 
 
+# Fixed-width `strptime` directives supported by `_fast_datetime_parser`, and
+# the argument of `datetime.datetime` each fills.
+_FAST_DIRECTIVES = {'Y': (4, 0), 'm': (2, 1), 'd': (2, 2), 'H': (2, 3),
+                    'M': (2, 4), 'S': (2, 5), 'f': (6, 6)}
+
+
+def _fast_datetime_parser(format):
+    '''Return a parser for strings with the exact width of `format`.
+
+    Only formats made of the directives in `_FAST_DIRECTIVES` and literal
+    characters are supported; otherwise return None.  The parser matches
+    fixed-width groups of digits and converts each with `int`; it returns
+    None if the value does not have the expected shape, so the caller may
+    fall back to `~datetime.datetime.strptime`:func: (which also gives the
+    right error).
+
+    '''
+    import re
+    from datetime import datetime
+    regex, args = [], []
+    i = 0
+    while i < len(format):
+        char = format[i]
+        if char == '%':
+            directive = format[i + 1:i + 2]
+            if directive not in _FAST_DIRECTIVES:
+                return None
+            width, arg = _FAST_DIRECTIVES[directive]
+            regex.append('(?P<_%d>\\d{%d})' % (arg, width))
+            args.append(arg)
+            i += 2
+        else:
+            regex.append(re.escape(char))
+            i += 1
+    # The arguments of `datetime` must be filled in order from the year.
+    if sorted(args) != list(range(max(len(args), 3))):
+        return None
+    match = re.compile(''.join(regex) + '\\Z').match
+    groups = tuple('_%d' % arg for arg in sorted(args))
+
+    def parse(val):
+        found = match(val)
+        if found:
+            try:
+                return datetime(*[int(part)
+                                  for part in found.group(*groups)])
+            except ValueError:
+                pass
+        return None
+    return parse
+
+
 @lru_cache()
-def datetime_reader(format, nullable=False, default=None, strict=True):
+def datetime_reader(format, nullable=False, default=None, strict=True,
+                    cache=None):
     '''Returns a datetime reader.
 
     :param format: The format the datetime is expected to be in the external
@@ -238,6 +461,10 @@ def datetime_reader(format, nullable=False, default=None, strict=True):
 
     :param strict: Whether to be strict about datetime format.
 
+    :param cache: If given, the maximum number of distinct values whose
+       result is kept (in a LRU cache) by the reader.  Useful for columns
+       with few distinct dates.
+
     The reader works first by passing the value to strict
     `datetime.datetime.strptime`:func: function.  If that fails with a
     ValueError and strict is True the reader fails entirely.
@@ -253,17 +480,29 @@ def datetime_reader(format, nullable=False, default=None, strict=True):
     .. versionchanged: 1.6.7.1  Keep the meaning of null when testing for
        `default` if strict is False and dateutil is not available.
 
+    .. versionchanged:: 1.7.0 Formats made only of ``%Y``, ``%m``, ``%d``,
+       ``%H``, ``%M``, ``%S``, ``%f`` and literals (like ``'%Y-%m-%d'``) are
+       parsed by slicing the value when it has the exact expected width;
+       `strptime` is used otherwise.  Added the `cache` argument.
+
     '''
+    from datetime import datetime
+    from six import string_types
     try:
         from dateutil.parser import parse
     except ImportError:
         parse = None
+    fast = _fast_datetime_parser(format)
+    strptime = datetime.strptime
 
     def reader(val):
         if check_nullable(val, nullable):
-            from datetime import datetime
+            if fast and isinstance(val, string_types):
+                res = fast(val)
+                if res is not None:
+                    return res
             try:
-                return datetime.strptime(val, format)
+                return strptime(val, format)
             except ValueError:
                 if strict:
                     raise
@@ -278,11 +517,15 @@ def datetime_reader(format, nullable=False, default=None, strict=True):
                         raise ValueError
         else:
             return default
+    if cache:
+        from xoutil.functools import lru_cache
+        reader = lru_cache(maxsize=cache)(reader)
     return reader
 
 
 @lru_cache()
-def date_reader(format, nullable=False, default=None, strict=True):
+def date_reader(format, nullable=False, default=None, strict=True,
+                cache=None):
     '''Return a date reader.
 
     This is similar to `datetime_reader`:func: but instead of returning a
@@ -293,9 +536,11 @@ def date_reader(format, nullable=False, default=None, strict=True):
 
     .. versionadded: 1.6.8
 
+    .. versionchanged:: 1.7.0 Added the `cache` argument.
+
     '''
     reader = datetime_reader(format, nullable=nullable, default=default,
-                             strict=strict)
+                             strict=strict, cache=cache)
 
     def res(val):
         result = reader(val)
@@ -322,14 +567,43 @@ def boolean_reader(true=('1', ), nullable=False, default=None):
     return reader
 
 
+def _get_value(raw_data, field):
+    '''The value of `field` in `raw_data` or Undefined if it's missing.'''
+    from xoutil import Undefined
+    try:
+        return raw_data[field]
+    except (IndexError, KeyError):
+        return Undefined
+
+
+def _numeric_typecode(typecode, nullable, default):
+    '''The `array`:mod: type code of a numeric reader or None if it may return
+    non-numbers.'''
+    from numbers import Number
+    if not nullable or isinstance(default, Number):
+        return typecode
+    else:
+        return None
+
+
 @lru_cache()
 def integer_reader(nullable=False, default=None):
-    '''Returns an integer reader.'''
+    '''Returns an integer reader.
+
+    .. versionchanged:: 1.7.0 If the reader always returns a number, its
+       `typecode` attribute is 'q' ('l' in Python 2, whose `array`:mod:
+       lacks 'q'; see `record.read_many`).
+
+    '''
+    from six import PY2
+
     def reader(val):
         if check_nullable(val, nullable):
             return int(val)
         else:
             return default
+    reader.typecode = _numeric_typecode('l' if PY2 else 'q', nullable,
+                                         default)
     return reader
 
 
@@ -347,12 +621,18 @@ def decimal_reader(nullable=False, default=None):
 
 @lru_cache()
 def float_reader(nullable=False, default=None):
-    '''Returns a float reader.'''
+    '''Returns a float reader.
+
+    .. versionchanged:: 1.7.0 If the reader always returns a number, its
+       `typecode` attribute is 'd' (see `record.read_many`).
+
+    '''
     def reader(val):
         if check_nullable(val, nullable):
             return float(val)
         else:
             return default
+    reader.typecode = _numeric_typecode('d', nullable, default)
     return reader
 
 
@@ -246,37 +246,107 @@ class mro_dict(Mapping):
     '''An utility class that behaves like a read-only dict to query the
     attributes in the MRO chain of a `target` class (or an object's class).
 
+    The first lookup probes the dicts of the classes in the MRO.  After that,
+    or when iterated or measured, the mapping builds (once) a flat index of
+    the names, so further lookups take constant time.  The index is not
+    updated when the classes change; call `refresh`:meth: to discard it.
+
+    .. versionchanged:: 1.7.0 Use a flat index of the names.
+
     '''
     def __init__(self, target):
         type_ = target if hasattr(target, 'mro') else type(target)
-        self._target_mro = type_.mro()
+        self._target_mro = type_.__mro__
+        self._index = None
+        self._names = None
+        self._probed = False
+
+    def _flattened(self):
+        '''Return the index ``{name: (owner, value)}``, building it if
+        needed.'''
+        index = self._index
+        if index is None:
+            index, names = {}, []
+            for cls in self._target_mro:
+                for name, value in cls.__dict__.items():
+                    if name not in index:
+                        index[name] = (cls, value)
+                        names.append(name)
+            self._index, self._names = index, names
+        return index
 
     def __getitem__(self, name):
-        from xoutil.objects import get_first_of
-        probes = tuple(c.__dict__ for c in self._target_mro)
-        result = get_first_of(probes, name, default=_unset)
-        if result is not _unset:
-            return result
-        else:
+        index = self._index
+        if index is None and not self._probed:
+            # A single lookup is cheaper than the index.
+            self._probed = True
+            for cls in self._target_mro:
+                result = cls.__dict__.get(name, _unset)
+                if result is not _unset:
+                    return result
             raise KeyError(name)
+        return self._flattened()[name][1]
+
+    def __contains__(self, name):
+        return name in self._flattened()
 
     def __iter__(self):
-        res = []
-        probes = tuple(c.__dict__ for c in self._target_mro)
-        for probe in probes:
-            for key in probe:
-                if key not in res:
-                    res.append(key)
-                    yield key
+        self._flattened()
+        return iter(self._names)
 
     def __len__(self):
-        return sum(1 for _ in self)
+        return len(self._flattened())
+
+    def owner(self, name):
+        '''Return the class in the MRO that defines `name`.
+
+        .. versionadded:: 1.7.0
+
+        '''
+        return self._flattened()[name][0]
+
+    def refresh(self):
+        '''Discard the index to see the changes of the classes.
+
+        .. versionadded:: 1.7.0
+
+        '''
+        self._index = self._names = None
+        self._probed = False
 
 
 # TODO: Many of is_*method methods here are needed to be compared against the
 # standard lib's module inspect versions.  If they behave the same, these
 # should be deprecated in favor of the standards.
 
+# The answers of `is_iterable`, `is_scalar` and `is_collection` for builtin
+# types that don't depend on the instance: ``{type: (iterable, scalar,
+# collection)}``.  Only exact types are looked up; any other object is
+# probed.
+_verdicts = {}
+
+
+def _type_verdict(maybe):
+    if not _verdicts:
+        from datetime import date, datetime, time, timedelta
+        from decimal import Decimal
+        from six import PY3, integer_types, text_type, binary_type
+        from six.moves import range
+        scalars = integer_types + (float, complex, bool, type(None),
+                                   Decimal, date, datetime, time, timedelta)
+        collections = (tuple, list, set, frozenset, range, GeneratorType)
+        iterables = (dict, bytearray, type({}.keys()), type({}.values()),
+                     type({}.items()))
+        if PY3:
+            # In Python 2, ``str + ""`` may fail to decode the string.
+            iterables += (binary_type, )
+        _verdicts.update((t, (False, True, False)) for t in scalars)
+        _verdicts.update((t, (True, False, False)) for t in iterables)
+        _verdicts.update((t, (True, False, True)) for t in collections)
+        _verdicts[text_type] = (True, True, False)
+    return _verdicts.get(type(maybe))
+
+
 def is_iterable(maybe):
     '''Returns True if `maybe` is an iterable object (e.g. implements the
     `__iter__` method):
@@ -304,6 +374,9 @@ def is_iterable(maybe):
         True
 
     '''
+    verdict = _type_verdict(maybe)
+    if verdict is not None:
+        return verdict[0]
     try:
         iter(maybe)
     except:
@@ -344,10 +417,19 @@ def is_collection(maybe):
     .. versionchanged:: 1.5.5 UserList are collections.
 
     '''
-    from xoutil.collections import UserList
-    from six.moves import range
-    return isinstance(maybe, (tuple, range, list, set, frozenset,
-                              GeneratorType, UserList))
+    verdict = _type_verdict(maybe)
+    if verdict is not None:
+        return verdict[2]
+    global _collection_types
+    if _collection_types is None:
+        from xoutil.collections import UserList
+        from six.moves import range
+        _collection_types = (tuple, range, list, set, frozenset,
+                             GeneratorType, UserList)
+    return isinstance(maybe, _collection_types)
+
+
+_collection_types = None
 
 
 def is_string_like(maybe):
@@ -365,6 +447,9 @@ def is_scalar(maybe):
     (i.e not an iterable.)
 
     '''
+    verdict = _type_verdict(maybe)
+    if verdict is not None:
+        return verdict[1]
     return is_string_like(maybe) or not is_iterable(maybe)
 
 